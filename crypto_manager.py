@@ -1,15 +1,47 @@
 import os
-import json
-import base64
+import time
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import pybase64 as base64  # SIMD-accelerated, API-compatible
+except ImportError:
+    import base64
 from datetime import datetime
 from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives import padding as sym_padding
 from cryptography.hazmat.primitives.asymmetric import padding as asym_padding
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 from cryptography.exceptions import InvalidSignature
 
+# Signatures older than this (seconds) trigger a freshness warning
+MAX_SIGNATURE_AGE = 30 * 86400
+
+if hasattr(base64, 'b64encode_as_string'):
+    # pybase64 builds the str directly, skipping a full-size bytes copy
+    _b64encode_str = base64.b64encode_as_string
+else:
+    def _b64encode_str(data):
+        return base64.b64encode(data).decode()
+
+# Overlaps signature checks with decryption in verify_and_decrypt. Shared by
+# every CryptoManager (the GUI makes one per login); created on first use.
+_verify_pool = None
+
+
+def _get_verify_pool():
+    global _verify_pool
+    if _verify_pool is None:
+        _verify_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _verify_pool
+
+
+def _utc_timestamp(epoch=None):
+    """Fixed-width UTC ISO-8601 timestamp (second resolution), e.g. 2024-01-01T12:00:00Z."""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch))
+
 
 class CryptoManager:
     """Manages cryptographic operations for diary entries."""
@@ -23,51 +55,101 @@ class CryptoManager:
         """
         self.key_manager = key_manager
 
-    def encrypt_entry(self, plaintext):
-        """
-        Encrypt diary entry using hybrid encryption (AES + RSA)
+        # Padding and hash objects are immutable, so build them once
+        self._sha256 = hashes.SHA256()
+        self._oaep = asym_padding.OAEP(
+            mgf=asym_padding.MGF1(algorithm=self._sha256),
+            algorithm=self._sha256,
+            label=None
+        )
+        self._pss = asym_padding.PSS(
+            mgf=asym_padding.MGF1(self._sha256),
+            salt_length=asym_padding.PSS.MAX_LENGTH
+        )
 
-        Args:
-            plaintext: Plain text diary entry
+        self._pub = None
+        self._priv = None
 
-        Returns:
-            Dictionary containing encrypted data and metadata
+    @property
+    def _public_key(self):
+        if self._pub is None:
+            self._pub = self.key_manager.get_public_key()
+        return self._pub
+
+    @property
+    def _private_key(self):
+        if self._priv is None:
+            self._priv = self.key_manager.get_private_key()
+        return self._priv
+
+    def invalidate_key_cache(self):
+        """Drop cached key objects; call after the KeyManager's keys change."""
+        self._pub = None
+        self._priv = None
+
+    def _is_revoked(self, cert_serial):
+        """O(1) check against the KeyManager's serial set, which reloads when the file changes."""
+        return self.key_manager.is_revoked(cert_serial)
+
+    def _aes_encrypt(self, aes_key, nonce, plaintext_bytes):
+        """AES-256-GCM encrypt with a caller-supplied 12-byte nonce. Returns ciphertext || tag."""
+        return AESGCM(aes_key).encrypt(nonce, plaintext_bytes, None)
+
+    def _aes_decrypt(self, aes_key, encrypted_data):
         """
-        aes_key = os.urandom(32)  # 256-bit key
-        iv = os.urandom(16)
+        Decrypt the AES layer of an entry.
 
-        # AES-CBC encryption
+        Entries with a 'nonce' are AES-GCM (authenticated, raises InvalidTag
+        on tampering); older entries with an 'iv' are AES-CBC with PKCS#7.
+        """
+        ciphertext = base64.b64decode(encrypted_data['ciphertext'])
+        if 'nonce' in encrypted_data:
+            nonce = base64.b64decode(encrypted_data['nonce'])
+            return AESGCM(aes_key).decrypt(nonce, ciphertext, None)
+
+        # Legacy AES-CBC entries
+        iv = base64.b64decode(encrypted_data['iv'])
         cipher = Cipher(
             algorithms.AES(aes_key),
-            modes.CBC(iv),
-            backend=default_backend()
+            modes.CBC(iv)
         )
-        encryptor = cipher.encryptor()
+        decryptor = cipher.decryptor()
+        padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+
+        unpadder = sym_padding.PKCS7(128).unpadder()
+        return unpadder.update(padded_plaintext) + unpadder.finalize()
+
+    def encrypt_entry(self, plaintext):
+        """
+        Encrypt diary entry using hybrid encryption (AES + RSA)
 
-        plaintext_bytes = plaintext.encode()
-        padding_length = 16 - (len(plaintext_bytes) % 16)
-        padded_plaintext = plaintext_bytes + bytes([padding_length] * padding_length)
+        Args:
+            plaintext: Plain text diary entry (str, or already-encoded bytes-like)
 
-        ciphertext = encryptor.update(padded_plaintext) + encryptor.finalize()
+        Returns:
+            Dictionary containing encrypted data and metadata
+        """
+        if isinstance(plaintext, str):
+            plaintext = plaintext.encode()
+        # One entropy draw for both the 256-bit key and the 96-bit nonce
+        rand = os.urandom(44)
+        aes_key, nonce = rand[:32], rand[32:]
+        ciphertext = self._aes_encrypt(aes_key, nonce, plaintext)
 
         # Encrypt AES key with RSA public key
-        public_key = self.key_manager.get_public_key()
-        encrypted_aes_key = public_key.encrypt(
-            aes_key,
-            asym_padding.OAEP(
-                mgf=asym_padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None
-            )
-        )
+        encrypted_aes_key = self._public_key.encrypt(aes_key, self._oaep)
 
         return {
-            'encrypted_key': base64.b64encode(encrypted_aes_key).decode(),
-            'iv': base64.b64encode(iv).decode(),
-            'ciphertext': base64.b64encode(ciphertext).decode(),
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'encrypted_key': _b64encode_str(encrypted_aes_key),
+            'nonce': _b64encode_str(nonce),
+            'ciphertext': _b64encode_str(ciphertext),
+            'timestamp': _utc_timestamp()
         }
 
+    def _unwrap_key(self, encrypted_key_b64):
+        """Decrypt a base64 RSA-OAEP wrapped AES key with the private key."""
+        return self._private_key.decrypt(base64.b64decode(encrypted_key_b64), self._oaep)
+
     def decrypt_entry(self, encrypted_data):
         """
         Decrypt diary entry
@@ -79,48 +161,43 @@ class CryptoManager:
             Decrypted plaintext
         """
         try:
-            encrypted_aes_key = base64.b64decode(encrypted_data['encrypted_key'])
-            iv = base64.b64decode(encrypted_data['iv'])
-            ciphertext = base64.b64decode(encrypted_data['ciphertext'])
-
-            private_key = self.key_manager.get_private_key()
-            aes_key = private_key.decrypt(
-                encrypted_aes_key,
-                asym_padding.OAEP(
-                    mgf=asym_padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
-            )
-
-            cipher = Cipher(
-                algorithms.AES(aes_key),
-                modes.CBC(iv),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-            padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
-
-            padding_length = padded_plaintext[-1]
-            plaintext = padded_plaintext[:-padding_length]
-
-            return plaintext.decode()
+            aes_key = self._unwrap_key(encrypted_data['encrypted_key'])
+            return self._aes_decrypt(aes_key, encrypted_data).decode()
 
         except Exception as e:
             raise Exception(f"Decryption failed: {str(e)}")
 
-    def _prepare_signed_data(self, data):
+    def _prepare_signed_data(self, data, timestamp):
         """
         Prepare data for signing by including a timestamp to prevent replay attacks.
+        The signed bytes are timestamp || '|' || data; ISO timestamps never
+        contain '|', so the framing is unambiguous.
         """
         if isinstance(data, str):
             data = data.encode()
-        # Create a signed structure with timestamp
-        signed_structure = {
-            'data': base64.b64encode(data).decode() if isinstance(data, bytes) else data,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
-        }
-        return json.dumps(signed_structure, sort_keys=True).encode()
+        return timestamp.encode() + b'|' + data
+
+    def _legacy_signed_data(self, data, timestamp):
+        """JSON framing used by signatures created before the raw format."""
+        if isinstance(data, str):
+            data = data.encode()
+        # Byte-for-byte what json.dumps({...}, sort_keys=True) produced: keys
+        # already sorted, default separators, and neither value needs escaping
+        return f'{{"data": "{_b64encode_str(data)}", "timestamp": "{timestamp}"}}'.encode()
+
+    def _sign(self, message):
+        """Sign with RSA-PSS, or plain Ed25519 for Ed25519 keys."""
+        key = self._private_key
+        if isinstance(key, ed25519.Ed25519PrivateKey):
+            return key.sign(message)
+        return key.sign(message, self._pss, self._sha256)
+
+    def _verify(self, pub_key, signature, message):
+        """Counterpart of _sign; raises InvalidSignature on mismatch."""
+        if isinstance(pub_key, ed25519.Ed25519PublicKey):
+            pub_key.verify(signature, message)
+        else:
+            pub_key.verify(signature, message, self._pss, self._sha256)
 
     def sign_entry(self, data):
         """
@@ -132,25 +209,16 @@ class CryptoManager:
         Returns:
             Dictionary with signature, timestamp, and certificate serial number
         """
-        prepared = self._prepare_signed_data(data)
-        private_key = self.key_manager.get_private_key()
-        signature = private_key.sign(
-            prepared,
-            asym_padding.PSS(
-                mgf=asym_padding.MGF1(hashes.SHA256()),
-                salt_length=asym_padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256()
-        )
-        # Return signature and the timestamp used
-        signed_structure = json.loads(prepared.decode())
-        
+        timestamp = _utc_timestamp()
+        prepared = self._prepare_signed_data(data, timestamp)
+        signature = self._sign(prepared)
+
         # Include certificate serial number for revocation checking
         cert_serial = self.key_manager.get_certificate_serial()
         
         return {
-            'signature': base64.b64encode(signature).decode(),
-            'signed_timestamp': signed_structure['timestamp'],
+            'signature': _b64encode_str(signature),
+            'signed_timestamp': timestamp,
             'cert_serial': cert_serial
         }
 
@@ -175,18 +243,12 @@ class CryptoManager:
             # First check if certificate is revoked
             is_revoked = False
             if cert_serial:
-                is_revoked = self.key_manager.is_revoked(cert_serial)
+                is_revoked = self._is_revoked(cert_serial)
                 if is_revoked:
                     print(f"Certificate {cert_serial} has been revoked")
             
             # Reconstruct the signed structure
-            if isinstance(data, str):
-                data = data.encode()
-            signed_structure = {
-                'data': base64.b64encode(data).decode() if isinstance(data, bytes) else data,
-                'timestamp': timestamp
-            }
-            prepared = json.dumps(signed_structure, sort_keys=True).encode()
+            prepared = self._prepare_signed_data(data, timestamp)
 
             signature = base64.b64decode(signature_b64)
 
@@ -196,26 +258,23 @@ class CryptoManager:
             elif public_key:
                 pub_key = public_key
             else:
-                pub_key = self.key_manager.get_public_key()
-
-            pub_key.verify(
-                signature,
-                prepared,
-                asym_padding.PSS(
-                    mgf=asym_padding.MGF1(hashes.SHA256()),
-                    salt_length=asym_padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
+                pub_key = self._public_key
+
+            try:
+                self._verify(pub_key, signature, prepared)
+            except InvalidSignature:
+                # Entries signed before the raw framing was introduced
+                legacy = self._legacy_signed_data(data, timestamp)
+                self._verify(pub_key, signature, legacy)
 
             # Optional: check timestamp freshness (e.g., not older than 30 days)
             try:
                 sig_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                now = datetime.utcnow().replace(tzinfo=sig_time.tzinfo)
-                if (now - sig_time).days > 30:
-                    print("Warning: Signature timestamp is older than 30 days.")
-            except:
-                pass  # Ignore timestamp parsing errors
+                age = time.time() - sig_time.timestamp()
+            except Exception:
+                age = 0  # Ignore timestamp parsing errors
+            if age > MAX_SIGNATURE_AGE:
+                print("Warning: Signature timestamp is older than 30 days.")
 
             return True, is_revoked
 
@@ -249,20 +308,46 @@ class CryptoManager:
         """
         is_valid = False
         is_revoked = False
-        
+        verify_future = None
+
         if 'signature' in encrypted_data and 'signed_timestamp' in encrypted_data:
             cert_serial = encrypted_data.get('cert_serial')
-            # Verify signature using own public key
-            is_valid, is_revoked = self.verify_signature(
+            # Verify signature using own public key on a worker thread while
+            # this thread decrypts; both OpenSSL calls release the GIL
+            verify_future = _get_verify_pool().submit(
+                self.verify_signature,
                 encrypted_data['ciphertext'],
                 encrypted_data['signature'],
                 encrypted_data['signed_timestamp'],
                 cert_serial=cert_serial
             )
-        
+
         plaintext = self.decrypt_entry(encrypted_data)
+        if verify_future is not None:
+            is_valid, is_revoked = verify_future.result()
         return plaintext, is_valid, is_revoked
 
+    def batch_encrypt_and_sign(self, plaintexts, max_workers=None):
+        """
+        Encrypt and sign many entries in parallel. OpenSSL releases the GIL
+        during RSA/AES work, so threads scale across cores.
+
+        Returns:
+            List of encrypt_and_sign results in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(self.encrypt_and_sign, plaintexts))
+
+    def batch_verify_and_decrypt(self, entries, max_workers=None):
+        """
+        Verify and decrypt many entries in parallel (see batch_encrypt_and_sign).
+
+        Returns:
+            List of (plaintext, is_valid, is_revoked) tuples in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(self.verify_and_decrypt, entries))
+
     # --- Export / Import for secure sharing ---
     def export_entry(self, entry_id, metadata, encrypted_data):
         """
@@ -291,11 +376,11 @@ class CryptoManager:
         """
         # Load certificate from package
         cert_pem = package['signer_certificate'].encode()
-        cert = x509.load_pem_x509_certificate(cert_pem, default_backend())
+        cert = x509.load_pem_x509_certificate(cert_pem)
 
         # Check revocation using global list
         cert_serial = str(cert.serial_number)
-        is_revoked = self.key_manager.is_revoked(cert_serial)
+        is_revoked = self._is_revoked(cert_serial)
 
         # Verify signature using the certificate's public key
         enc_data = package['encrypted_data']
@@ -1,12 +1,28 @@
 import os
-import json
+import mmap
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
+from jsonio import dumps, loads, orjson
+
+
+def _load_file(path):
+    """Parse a JSON file; with orjson, parse straight from a read-only mmap."""
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
 
 class DiaryStorage:
     """Manages storage of encrypted diary entries"""
 
+    # Fold the index journal into index.json after this many mutations
+    COMPACT_EVERY = 100
+
     def __init__(self, storage_path="diary_entries", user_dir=None):
         """
         Initialize DiaryStorage
@@ -21,20 +37,99 @@ class DiaryStorage:
             self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         self.index_file = self.storage_path / "index.json"
+        self.log_file = self.storage_path / "index.log"
         self._load_index()
 
     def _load_index(self):
-        """Load the diary entries index"""
+        """Load the index snapshot and replay the mutation journal on top"""
         if self.index_file.exists():
-            with open(self.index_file, 'r') as f:
-                self.index = json.load(f)
+            self.index = _load_file(self.index_file)
         else:
             self.index = {'entries': []}
+        # id -> metadata lookup; shares the dicts held in self.index
+        self._by_id = {e['id']: e for e in self.index['entries']}
+
+        self._log_ops = 0
+        if self.log_file.exists():
+            torn = False
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        # Torn final line from an interrupted write
+                        torn = True
+                        continue
+                    self._apply(record)
+                    self._log_ops += 1
+            # Compact before appending so new records never follow a torn line
+            if torn or self._log_ops >= self.COMPACT_EVERY:
+                self._save_index()
+
+        self._sorted_dirty = True
+        self._sorted_cache = []
+
+        self._search_blobs = {}
+        self._by_tag = defaultdict(set)
+        for entry in self.index['entries']:
+            self._index_search(entry)
+
+    def _index_search(self, entry):
+        """Record the lowercase search text and tags for one entry"""
+        tags = [t.lower() for t in entry.get('tags', [])]
+        # NUL separators keep a query from matching across title/tag boundaries
+        self._search_blobs[entry['id']] = '\0'.join([entry['title'].lower()] + tags)
+        for tag in tags:
+            self._by_tag[tag].add(entry['id'])
+
+    def _unindex_search(self, entry):
+        """Forget the search text and tags recorded for one entry"""
+        self._search_blobs.pop(entry['id'], None)
+        for tag in entry.get('tags', []):
+            ids = self._by_tag.get(tag.lower())
+            if ids is not None:
+                ids.discard(entry['id'])
+                if not ids:
+                    del self._by_tag[tag.lower()]
+
+    def _apply(self, record):
+        """Apply one journal record to the in-memory index"""
+        op = record['op']
+        if op in ('add', 'update'):
+            meta = record['meta']
+            existing = self._by_id.get(meta['id'])
+            if existing is not None:
+                existing.update(meta)
+            elif op == 'add':
+                self.index['entries'].append(meta)
+                self._by_id[meta['id']] = meta
+        elif op == 'delete':
+            existing = self._by_id.pop(record['id'], None)
+            if existing is not None:
+                self.index['entries'].remove(existing)
+
+    def _log(self, record):
+        """Append one mutation to the journal, compacting when it grows long"""
+        with open(self.log_file, 'ab') as f:
+            f.write(dumps(record) + b'\n')
+        self._log_ops += 1
+        if self._log_ops >= self.COMPACT_EVERY:
+            self._save_index()
 
     def _save_index(self):
-        """Save the diary entries index"""
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        """Atomically write a compact index snapshot and reset the journal"""
+        tmp_file = self.index_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(dumps(self.index))
+        os.replace(tmp_file, self.index_file)
+        if self.log_file.exists():
+            self.log_file.unlink()
+        self._log_ops = 0
+
+    def close(self):
+        """Compact any pending journal records into index.json"""
+        if self._log_ops:
+            self._save_index()
 
     def save_entry(self, title, encrypted_data, tags=None):
         """
@@ -48,27 +143,32 @@ class DiaryStorage:
         Returns:
             Entry ID
         """
-        # Generate entry ID
-        entry_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        # Generate entry ID (one clock read shared by id and timestamps)
+        now = datetime.now()
+        iso_now = now.isoformat()
+        entry_id = now.strftime("%Y%m%d_%H%M%S_%f")
 
         # Create entry metadata
         entry_metadata = {
             'id': entry_id,
             'title': title,
-            'created': datetime.now().isoformat(),
-            'modified': datetime.now().isoformat(),
+            'created': iso_now,
+            'modified': iso_now,
             'tags': tags or [],
             'filename': f"{entry_id}.json"
         }
 
         # Save encrypted entry data
         entry_file = self.storage_path / entry_metadata['filename']
-        with open(entry_file, 'w') as f:
-            json.dump(encrypted_data, f, indent=2)
+        with open(entry_file, 'wb') as f:
+            f.write(dumps(encrypted_data))
 
         # Update index
         self.index['entries'].append(entry_metadata)
-        self._save_index()
+        self._by_id[entry_id] = entry_metadata
+        self._index_search(entry_metadata)
+        self._sorted_dirty = True
+        self._log({'op': 'add', 'meta': entry_metadata})
 
         return entry_id
 
@@ -85,30 +185,28 @@ class DiaryStorage:
         Returns:
             True if successful, False otherwise
         """
-        # Find entry in index
-        entry_metadata = None
-        for entry in self.index['entries']:
-            if entry['id'] == entry_id:
-                entry_metadata = entry
-                break
+        entry_metadata = self._by_id.get(entry_id)
 
         if not entry_metadata:
             return False
 
         # Update metadata
+        self._unindex_search(entry_metadata)
         if title is not None:
             entry_metadata['title'] = title
         if tags is not None:
             entry_metadata['tags'] = tags
         entry_metadata['modified'] = datetime.now().isoformat()
+        self._index_search(entry_metadata)
+        self._sorted_dirty = True
 
         # Update encrypted data if provided
         if encrypted_data is not None:
             entry_file = self.storage_path / entry_metadata['filename']
-            with open(entry_file, 'w') as f:
-                json.dump(encrypted_data, f, indent=2)
+            with open(entry_file, 'wb') as f:
+                f.write(dumps(encrypted_data))
 
-        self._save_index()
+        self._log({'op': 'update', 'meta': entry_metadata})
         return True
 
     def load_entry(self, entry_id):
@@ -121,12 +219,7 @@ class DiaryStorage:
         Returns:
             Tuple (metadata, encrypted_data) or (None, None) if not found
         """
-        # Find entry in index
-        entry_metadata = None
-        for entry in self.index['entries']:
-            if entry['id'] == entry_id:
-                entry_metadata = entry
-                break
+        entry_metadata = self._by_id.get(entry_id)
 
         if not entry_metadata:
             return None, None
@@ -136,8 +229,7 @@ class DiaryStorage:
         if not entry_file.exists():
             return None, None
 
-        with open(entry_file, 'r') as f:
-            encrypted_data = json.load(f)
+        encrypted_data = _load_file(entry_file)
 
         return entry_metadata, encrypted_data
 
@@ -152,23 +244,32 @@ class DiaryStorage:
             True if successful, False otherwise
         """
         # Find and remove from index
-        entry_metadata = None
-        for i, entry in enumerate(self.index['entries']):
-            if entry['id'] == entry_id:
-                entry_metadata = self.index['entries'].pop(i)
-                break
-
+        entry_metadata = self._by_id.pop(entry_id, None)
         if not entry_metadata:
             return False
+        self.index['entries'].remove(entry_metadata)
+        self._unindex_search(entry_metadata)
+        self._sorted_dirty = True
 
         # Delete entry file
         entry_file = self.storage_path / entry_metadata['filename']
         if entry_file.exists():
             entry_file.unlink()
 
-        self._save_index()
+        self._log({'op': 'delete', 'id': entry_id})
         return True
 
+    def _sorted_entries(self):
+        """Entries sorted newest first, re-sorted only after a mutation"""
+        if self._sorted_dirty:
+            self._sorted_cache = sorted(
+                self.index['entries'],
+                key=lambda x: x['created'],
+                reverse=True
+            )
+            self._sorted_dirty = False
+        return self._sorted_cache
+
     def list_entries(self):
         """
         List all diary entries
@@ -176,13 +277,9 @@ class DiaryStorage:
         Returns:
             List of entry metadata dictionaries
         """
-        # Sort by creation date (newest first)
-        sorted_entries = sorted(
-            self.index['entries'],
-            key=lambda x: x['created'],
-            reverse=True
-        )
-        return sorted_entries
+        # Sorted by creation date (newest first); copy so callers can't
+        # disturb the cache
+        return list(self._sorted_entries())
 
     def search_entries(self, query):
         """
@@ -195,24 +292,26 @@ class DiaryStorage:
             List of matching entry metadata
         """
         query_lower = query.lower()
-        matching_entries = []
+        blobs = self._search_blobs
+        # Filtering the sorted cache keeps newest-first order without a sort
+        return [
+            entry for entry in self._sorted_entries()
+            if query_lower in blobs[entry['id']]
+        ]
+
+    def entries_with_tag(self, tag):
+        """
+        Find entries carrying an exact tag (case-insensitive)
 
-        for entry in self.index['entries']:
-            # Check title
-            if query_lower in entry['title'].lower():
-                matching_entries.append(entry)
-                continue
-
-            # Check tags
-            for tag in entry.get('tags', []):
-                if query_lower in tag.lower():
-                    matching_entries.append(entry)
-                    break
-
-        # Sort by creation date (newest first)
-        sorted_entries = sorted(
-            matching_entries,
+        Args:
+            tag: Tag to look up
+
+        Returns:
+            List of matching entry metadata, newest first
+        """
+        ids = self._by_tag.get(tag.lower(), ())
+        return sorted(
+            (self._by_id[entry_id] for entry_id in ids),
             key=lambda x: x['created'],
             reverse=True
         )
-        return sorted_entries
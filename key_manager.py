@@ -1,15 +1,64 @@
 import os
-import json
 import base64
+import hashlib
+import struct
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives import padding as sym_padding
+from cryptography.hazmat.primitives.asymmetric import rsa, ed25519
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidTag
+try:
+    from argon2.low_level import hash_secret_raw, Type as Argon2Type
+except ImportError:
+    hash_secret_raw = None
+from jsonio import dumps, loads
+
+# KDF cost for new keystores; the parameters are stored in the keystore so
+# they can be raised later without breaking existing files.
+ARGON2_PARAMS = {'time_cost': 3, 'memory_cost': 65536, 'parallelism': 4}
+SCRYPT_PARAMS = {'n': 2 ** 15, 'r': 8, 'p': 1}
+# Keystores written before the KDF was recorded used PBKDF2 with AES-CBC
+LEGACY_PBKDF2_ITERATIONS = 100000
+
+# Decrypted keystores kept in memory, keyed by file identity and a keyed
+# hash of the password (the raw password is never stored).
+KEYSTORE_CACHE_SIZE = 32
+_keystore_cache = OrderedDict()
+_keystore_cache_secret = os.urandom(16)
+
+
+def _keystore_cache_key(path, password):
+    st = os.stat(path)
+    digest = hashlib.blake2b(password.encode(), digest_size=16, key=_keystore_cache_secret).hexdigest()
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size, digest)
+
+
+_keygen_pool = None
+
+
+def _generate_rsa_der(key_size):
+    """Worker for generate_key_pair_async; returns the key as PKCS8 DER (key objects don't pickle)."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    return key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+
+
+def _forget_keystore(path):
+    path = os.path.abspath(path)
+    for key in [k for k in _keystore_cache if k[0] == path]:
+        del _keystore_cache[key]
 
 
 class KeyManager:
@@ -30,21 +79,75 @@ class KeyManager:
             self.keystore_path = keystore_path
             self.cert_path = "certificate.pem"
         
-        # Global revocation list (shared across all users)
-        self.global_revoked_path = "revoked_certificates.json"
+        # Global revocation list (shared across all users), one JSON record
+        # per line; the old single-document file is migrated on first load
+        self.global_revoked_path = "revoked_certificates.jsonl"
+        self.legacy_revoked_path = "revoked_certificates.json"
+        self._revoked_cache = None
+        self._revoked_mtime = 0
+        self._revoked_serials = set()
         self.private_key = None
         self.public_key = None
         self.certificate = None
+        # Serial of the certificate currently in cert_path, to skip rewriting it
+        self._last_written_cert_serial = None
+        # (object, PEM) of the last export; stale once the key/cert is replaced
+        self._public_pem_cache = None
+        self._cert_pem_cache = None
+        self._cert_details_cache = None
+
+    def generate_key_pair(self, key_size=2048, algo='rsa'):
+        """
+        Generate a new key pair.
 
-    def generate_key_pair(self, key_size=2048):
-        """Generate a new RSA key pair."""
-        self.private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=key_size,
-            backend=default_backend()
-        )
+        Args:
+            key_size: RSA modulus size in bits (ignored for Ed25519)
+            algo: 'rsa' or 'ed25519'. Ed25519 keys can sign and verify but
+                cannot wrap entry keys, so diary encryption needs RSA.
+        """
+        if algo == 'ed25519':
+            self.private_key = ed25519.Ed25519PrivateKey.generate()
+        elif algo == 'rsa':
+            self.private_key = rsa.generate_private_key(
+                public_exponent=65537,
+                key_size=key_size
+            )
+        else:
+            raise ValueError(f"Unsupported key algorithm: {algo}")
         self.public_key = self.private_key.public_key()
 
+    def generate_key_pair_async(self, key_size=2048, executor=None):
+        """
+        Generate an RSA key pair in a worker process so the caller (e.g. the
+        UI thread) is not blocked.
+
+        Args:
+            key_size: RSA modulus size in bits
+            executor: Process pool to run on; defaults to a shared single-worker pool
+
+        Returns:
+            Future resolving to the private key once it has been installed
+            on this KeyManager
+        """
+        global _keygen_pool
+        if executor is None:
+            if _keygen_pool is None:
+                _keygen_pool = ProcessPoolExecutor(max_workers=1)
+            executor = _keygen_pool
+
+        result = Future()
+
+        def _install(done):
+            try:
+                self.private_key = serialization.load_der_private_key(done.result(), password=None)
+                self.public_key = self.private_key.public_key()
+                result.set_result(self.private_key)
+            except Exception as e:
+                result.set_exception(e)
+
+        executor.submit(_generate_rsa_der, key_size).add_done_callback(_install)
+        return result
+
     def generate_self_signed_certificate(self, subject_name):
         """
         Generate a self-signed X.509 certificate for the user.
@@ -72,18 +175,53 @@ class KeyManager:
             datetime.utcnow() + timedelta(days=365)  # 1 year validity
         ).add_extension(
             x509.BasicConstraints(ca=False, path_length=None), critical=True,
-        ).sign(self.private_key, hashes.SHA256(), default_backend())
-
-    def _derive_key_from_password(self, password, salt):
-        """Derive encryption key from password using PBKDF2."""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
+        ).sign(
+            self.private_key,
+            # Ed25519 has a fixed hash and must be signed with algorithm=None
+            None if isinstance(self.private_key, ed25519.Ed25519PrivateKey) else hashes.SHA256()
         )
-        return kdf.derive(password.encode())
+
+    def _default_kdf(self):
+        """KDF parameters for a new keystore: Argon2id if available, else scrypt."""
+        if hash_secret_raw is not None:
+            return dict(ARGON2_PARAMS, name='argon2id')
+        return dict(SCRYPT_PARAMS, name='scrypt')
+
+    def _derive_key_from_password(self, password, salt, kdf=None):
+        """
+        Derive encryption key from password.
+
+        Args:
+            password: Keystore password
+            salt: Random salt
+            kdf: KDF parameters stored in the keystore; None means the
+                legacy PBKDF2 derivation
+        """
+        if kdf is None:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=salt,
+                iterations=LEGACY_PBKDF2_ITERATIONS
+            )
+            return kdf.derive(password.encode())
+
+        if kdf['name'] == 'argon2id':
+            if hash_secret_raw is None:
+                raise ValueError("Keystore uses Argon2id but argon2-cffi is not installed")
+            return hash_secret_raw(
+                password.encode(), salt,
+                time_cost=kdf['time_cost'],
+                memory_cost=kdf['memory_cost'],
+                parallelism=kdf['parallelism'],
+                hash_len=32,
+                type=Argon2Type.ID
+            )
+
+        if kdf['name'] == 'scrypt':
+            return Scrypt(salt=salt, length=32, n=kdf['n'], r=kdf['r'], p=kdf['p']).derive(password.encode())
+
+        raise ValueError(f"Unknown keystore KDF: {kdf['name']}")
 
     def save_keystore(self, password):
         """
@@ -95,68 +233,92 @@ class KeyManager:
         if not self.private_key:
             raise ValueError("No keys to save. Generate keys first.")
 
-        # Serialize private key
-        private_pem = self.private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
+        # Serialize keys and certificate as DER
+        private_der = self.private_key.private_bytes(
+            encoding=serialization.Encoding.DER,
             format=serialization.PrivateFormat.PKCS8,
             encryption_algorithm=serialization.NoEncryption()
         )
-
-        # Serialize public key
-        public_pem = self.public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
+        public_der = self.public_key.public_bytes(
+            encoding=serialization.Encoding.DER,
             format=serialization.PublicFormat.SubjectPublicKeyInfo
         )
+        cert_der = self.certificate.public_bytes(serialization.Encoding.DER) if self.certificate else b''
 
-        # Serialize certificate if exists
-        cert_pem = None
-        if self.certificate:
-            cert_pem = self.certificate.public_bytes(serialization.Encoding.PEM)
+        # Length-prefixed binary payload (an empty certificate means none)
+        payload = struct.pack('<III', len(private_der), len(public_der), len(cert_der)) \
+            + private_der + public_der + cert_der
 
-        # Create keystore data
-        keystore_data = {
-            'private_key': base64.b64encode(private_pem).decode(),
-            'public_key': base64.b64encode(public_pem).decode(),
-        }
-        if cert_pem:
-            keystore_data['certificate'] = base64.b64encode(cert_pem).decode()
-
-        # Generate random salt and IV
-        salt = os.urandom(16)
-        iv = os.urandom(16)
+        # Generate random salt and nonce from a single draw
+        rand = os.urandom(28)
+        salt, nonce = rand[:16], rand[16:]
 
         # Derive encryption key from password
-        key = self._derive_key_from_password(password, salt)
-
-        # Encrypt keystore data
-        cipher = Cipher(
-            algorithms.AES(key),
-            modes.CBC(iv),
-            backend=default_backend()
-        )
-        encryptor = cipher.encryptor()
+        kdf = self._default_kdf()
+        key = self._derive_key_from_password(password, salt, kdf)
 
-        # Convert to JSON and pad
-        json_data = json.dumps(keystore_data).encode()
-        padding_length = 16 - (len(json_data) % 16)
-        padded_data = json_data + bytes([padding_length] * padding_length)
-
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+        # Encrypt keystore data (GCM authenticates, so no padding or separate MAC)
+        encrypted_data = AESGCM(key).encrypt(nonce, payload, None)
 
         # Save encrypted keystore
         keystore = {
+            'format': 'der',
+            'kdf': kdf,
             'salt': base64.b64encode(salt).decode(),
-            'iv': base64.b64encode(iv).decode(),
+            'nonce': base64.b64encode(nonce).decode(),
             'data': base64.b64encode(encrypted_data).decode()
         }
 
-        with open(self.keystore_path, 'w') as f:
-            json.dump(keystore, f, indent=2)
+        with open(self.keystore_path, 'wb') as f:
+            f.write(dumps(keystore))
+        _forget_keystore(self.keystore_path)
 
-        # Also save certificate separately for easy access (optional)
-        if self.certificate:
+        # Also save certificate separately for easy access (optional), only
+        # when it differs from the one already written
+        if self.certificate and self.certificate.serial_number != self._last_written_cert_serial:
             with open(self.cert_path, 'wb') as f:
-                f.write(cert_pem)
+                f.write(self.export_certificate_pem().encode())
+            self._last_written_cert_serial = self.certificate.serial_number
+
+    def _load_der_payload(self, payload):
+        """Load keys from the length-prefixed DER payload written by save_keystore."""
+        priv_len, pub_len, cert_len = struct.unpack_from('<III', payload)
+        view = memoryview(payload)[12:]
+        self.private_key = serialization.load_der_private_key(bytes(view[:priv_len]), password=None)
+        self.public_key = serialization.load_der_public_key(bytes(view[priv_len:priv_len + pub_len]))
+        if cert_len:
+            self.certificate = x509.load_der_x509_certificate(bytes(view[priv_len + pub_len:priv_len + pub_len + cert_len]))
+        else:
+            self.certificate = None
+
+    def _load_pem_payload(self, keystore_data):
+        """Load keys from the older JSON payload of base64-wrapped PEMs."""
+        # Load private key
+        private_pem = base64.b64decode(keystore_data['private_key'])
+        self.private_key = serialization.load_pem_private_key(
+            private_pem,
+            password=None
+        )
+
+        # Load public key
+        public_pem = base64.b64decode(keystore_data['public_key'])
+        self.public_key = serialization.load_pem_public_key(
+            public_pem
+        )
+
+        # Load certificate if present
+        if 'certificate' in keystore_data:
+            cert_pem = base64.b64decode(keystore_data['certificate'])
+            self.certificate = x509.load_pem_x509_certificate(cert_pem)
+        else:
+            self.certificate = None
+
+    def _note_cert_file(self):
+        """Remember that cert_path already holds the loaded certificate."""
+        if self.certificate and os.path.exists(self.cert_path):
+            self._last_written_cert_serial = self.certificate.serial_number
+        else:
+            self._last_written_cert_serial = None
 
     def load_keystore(self, password):
         """
@@ -171,53 +333,54 @@ class KeyManager:
         if not os.path.exists(self.keystore_path):
             return False
 
+        # Same file, same password: reuse the keys without re-running the KDF
+        cache_key = _keystore_cache_key(self.keystore_path, password)
+        cached = _keystore_cache.get(cache_key)
+        if cached is not None:
+            _keystore_cache.move_to_end(cache_key)
+            self.private_key, self.public_key, self.certificate = cached
+            self._note_cert_file()
+            return True
+
         try:
-            with open(self.keystore_path, 'r') as f:
-                keystore = json.load(f)
+            with open(self.keystore_path, 'rb') as f:
+                keystore = loads(f.read())
 
             salt = base64.b64decode(keystore['salt'])
-            iv = base64.b64decode(keystore['iv'])
             encrypted_data = base64.b64decode(keystore['data'])
 
-            key = self._derive_key_from_password(password, salt)
-
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.CBC(iv),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-            decrypted_padded = decryptor.update(encrypted_data) + decryptor.finalize()
-
-            padding_length = decrypted_padded[-1]
-            decrypted_data = decrypted_padded[:-padding_length]
-
-            keystore_data = json.loads(decrypted_data.decode())
-
-            # Load private key
-            private_pem = base64.b64decode(keystore_data['private_key'])
-            self.private_key = serialization.load_pem_private_key(
-                private_pem,
-                password=None,
-                backend=default_backend()
-            )
-
-            # Load public key
-            public_pem = base64.b64decode(keystore_data['public_key'])
-            self.public_key = serialization.load_pem_public_key(
-                public_pem,
-                backend=default_backend()
-            )
-
-            # Load certificate if present
-            if 'certificate' in keystore_data:
-                cert_pem = base64.b64decode(keystore_data['certificate'])
-                self.certificate = x509.load_pem_x509_certificate(cert_pem, default_backend())
+            if 'nonce' in keystore:
+                key = self._derive_key_from_password(password, salt, keystore['kdf'])
+                nonce = base64.b64decode(keystore['nonce'])
+                decrypted_data = AESGCM(key).decrypt(nonce, encrypted_data, None)
+            else:
+                # Legacy keystore: PBKDF2 + AES-CBC with PKCS7 padding
+                key = self._derive_key_from_password(password, salt)
+                iv = base64.b64decode(keystore['iv'])
+                cipher = Cipher(
+                    algorithms.AES(key),
+                    modes.CBC(iv)
+                )
+                decryptor = cipher.decryptor()
+                decrypted_padded = decryptor.update(encrypted_data) + decryptor.finalize()
+
+                unpadder = sym_padding.PKCS7(128).unpadder()
+                decrypted_data = unpadder.update(decrypted_padded) + unpadder.finalize()
+
+            if keystore.get('format') == 'der':
+                self._load_der_payload(decrypted_data)
             else:
-                self.certificate = None
+                self._load_pem_payload(loads(decrypted_data))
 
+            self._note_cert_file()
+            _keystore_cache[cache_key] = (self.private_key, self.public_key, self.certificate)
+            if len(_keystore_cache) > KEYSTORE_CACHE_SIZE:
+                _keystore_cache.popitem(last=False)
             return True
 
+        except InvalidTag:
+            print("Error loading keystore: wrong password or keystore has been tampered with")
+            return False
         except Exception as e:
             print(f"Error loading keystore: {e}")
             return False
@@ -240,11 +403,13 @@ class KeyManager:
     def export_public_key_pem(self):
         if not self.public_key:
             return None
-        pem = self.public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        return pem.decode()
+        if self._public_pem_cache is None or self._public_pem_cache[0] is not self.public_key:
+            pem = self.public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            self._public_pem_cache = (self.public_key, pem.decode())
+        return self._public_pem_cache[1]
 
     def export_private_key_pem(self, password=None):
         """
@@ -276,20 +441,25 @@ class KeyManager:
     def export_certificate_pem(self):
         if not self.certificate:
             return None
-        return self.certificate.public_bytes(serialization.Encoding.PEM).decode()
+        if self._cert_pem_cache is None or self._cert_pem_cache[0] is not self.certificate:
+            pem = self.certificate.public_bytes(serialization.Encoding.PEM)
+            self._cert_pem_cache = (self.certificate, pem.decode())
+        return self._cert_pem_cache[1]
 
     def get_certificate_details(self):
         """
         Get detailed certificate information as a dictionary.
+        Computed once per certificate and reused until it is replaced.
         
         Returns:
             Dictionary with certificate details or None
         """
         if not self.certificate:
             return None
+        if self._cert_details_cache is not None and self._cert_details_cache[0] is self.certificate:
+            return self._cert_details_cache[1]
         
         subject = self.certificate.subject
-        issuer = self.certificate.issuer
         
         # Extract common name from subject
         cn = subject.get_attributes_for_oid(NameOID.COMMON_NAME)
@@ -304,10 +474,19 @@ class KeyManager:
         if isinstance(public_key, rsa.RSAPublicKey):
             key_size = public_key.key_size
             key_algorithm = f"RSA {key_size}"
+        elif isinstance(public_key, ed25519.Ed25519PublicKey):
+            key_algorithm = "Ed25519"
         else:
             key_algorithm = "Unknown"
+
+        try:
+            basic_constraints = self.certificate.extensions.get_extension_for_oid(
+                x509.oid.ExtensionOID.BASIC_CONSTRAINTS)
+            is_ca = basic_constraints.value.ca
+        except x509.ExtensionNotFound:
+            is_ca = False
         
-        return {
+        details = {
             'subject': cn_value,
             'issuer': cn_value,  # Self-signed, so same as subject
             'serial_number': str(self.certificate.serial_number),
@@ -317,8 +496,10 @@ class KeyManager:
             'signature_algorithm': self.certificate.signature_algorithm_oid._name,
             'version': self.certificate.version.value,
             'organization': org_value,
-            'is_ca': self.certificate.extensions.get_extension_for_oid(x509.oid.ExtensionOID.BASIC_CONSTRAINTS).value.ca if self.certificate.extensions.get_extension_for_oid(x509.oid.ExtensionOID.BASIC_CONSTRAINTS) else False
+            'is_ca': is_ca
         }
+        self._cert_details_cache = (self.certificate, details)
+        return details
 
     def get_public_key_details(self):
         """
@@ -339,6 +520,12 @@ class KeyManager:
                 'modulus_length': numbers.n.bit_length(),
                 'pem': self.export_public_key_pem()
             }
+        elif isinstance(self.public_key, ed25519.Ed25519PublicKey):
+            return {
+                'algorithm': 'Ed25519',
+                'key_size': 256,
+                'pem': self.export_public_key_pem()
+            }
         else:
             return {
                 'algorithm': 'Unknown',
@@ -346,17 +533,67 @@ class KeyManager:
             }
 
     # --- Global Revocation methods ---
+    def _stat_revoked(self):
+        try:
+            st = os.stat(self.global_revoked_path)
+            return (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _read_revoked_log(self):
+        """Parse the revocation log, returning (entries, needs_compaction)."""
+        entries = []
+        seen = set()
+        dirty = False
+        with open(self.global_revoked_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    # Torn final write from a crash; drop it and rewrite the file
+                    dirty = True
+                    continue
+                if entry['serial'] in seen:
+                    dirty = True
+                    continue
+                seen.add(entry['serial'])
+                entries.append(entry)
+        return entries, dirty
+
     def _load_global_revoked(self):
-        """Load the global certificate revocation list."""
-        if os.path.exists(self.global_revoked_path):
-            with open(self.global_revoked_path, 'r') as f:
-                return json.load(f)
-        return {'revoked': []}
+        """
+        Load the global certificate revocation list.
+        The parsed list is reused until the file's mtime changes.
+        """
+        mtime = self._stat_revoked()
+
+        if self._revoked_cache is None or mtime != self._revoked_mtime:
+            if mtime is not None:
+                entries, dirty = self._read_revoked_log()
+            elif os.path.exists(self.legacy_revoked_path):
+                with open(self.legacy_revoked_path, 'rb') as f:
+                    entries = loads(f.read())['revoked']
+                dirty = True
+            else:
+                entries, dirty = [], False
+
+            self._revoked_cache = {'revoked': entries}
+            self._revoked_serials = {entry['serial'] for entry in entries}
+            if dirty:
+                self._save_global_revoked(self._revoked_cache)
+            self._revoked_mtime = self._stat_revoked()
+        return self._revoked_cache
 
     def _save_global_revoked(self, revoked_data):
-        """Save the global certificate revocation list."""
-        with open(self.global_revoked_path, 'w') as f:
-            json.dump(revoked_data, f, indent=2)
+        """Compact the revocation log: rewrite it to a temp file and atomically swap it in."""
+        tmp_path = self.global_revoked_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(dumps(entry) + b'\n' for entry in revoked_data['revoked']))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.global_revoked_path)
 
     def revoke_certificate(self, serial_number, username=None):
         """
@@ -365,22 +602,29 @@ class KeyManager:
         Args:
             serial_number: Certificate serial number to revoke
             username: Username who revoked it (for audit)
+
+        Returns:
+            True if newly revoked, False if the serial was already revoked
         """
         revoked = self._load_global_revoked()
         
-        # Check if already revoked
-        for entry in revoked['revoked']:
-            if entry['serial'] == serial_number:
-                return False
+        # Check if already revoked (O(1) against the serial set)
+        if serial_number in self._revoked_serials:
+            return False
         
-        # Add to revocation list with timestamp
-        revoked['revoked'].append({
+        # Append to revocation log with timestamp
+        entry = {
             'serial': serial_number,
             'revoked_by': username if username else 'unknown',
             'timestamp': datetime.utcnow().isoformat() + 'Z'
-        })
-        
-        self._save_global_revoked(revoked)
+        }
+        with open(self.global_revoked_path, 'ab') as f:
+            f.write(dumps(entry) + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+        revoked['revoked'].append(entry)
+        self._revoked_serials.add(serial_number)
+        self._revoked_mtime = self._stat_revoked()
         return True
 
     def is_revoked(self, serial_number):
@@ -393,13 +637,15 @@ class KeyManager:
         Returns:
             True if revoked, False otherwise
         """
-        revoked = self._load_global_revoked()
-        for entry in revoked['revoked']:
-            if entry['serial'] == serial_number:
-                return True
-        return False
+        self._load_global_revoked()
+        return serial_number in self._revoked_serials
 
     def get_revoked_certificates(self):
         """Get the list of all revoked certificates."""
         revoked = self._load_global_revoked()
-        return revoked['revoked']
+        return list(revoked['revoked'])
+
+    def list_revoked_serials(self):
+        """Get the serial numbers of all revoked certificates."""
+        self._load_global_revoked()
+        return list(self._revoked_serials)
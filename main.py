@@ -1,11 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, simpledialog, filedialog
-from datetime import datetime
-import json
+from tkinter import font as tkfont
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import importlib
+import threading
+from jsonio import dumps, loads
 from user_manager import UserManager
-from key_manager import KeyManager
-from crypto_manager import CryptoManager
-from diary_storage import DiaryStorage
+# KeyManager, CryptoManager and DiaryStorage are imported in login(): they are
+# not needed to draw the login screen, and are pre-loaded while the user types.
 
 
 # ─── Colour Palette ───────────────────────────────────────────────────────────
@@ -42,205 +45,291 @@ FONT_SMALL   = ('Segoe UI', 9)
 FONT_MONO    = ('Consolas', 9)
 FONT_ENTRY   = ('Segoe UI', 11)
 FONT_ICON    = ('Segoe UI', 20)
-# ──────────────────────────────────────────────────────────────────────────────
 
+# Named Tk fonts for widgets, created once per root by create_named_fonts().
+# Widgets refer to them by name, so Tk shares one font object instead of
+# resolving a (family, size, style) tuple for every widget.
+FONT_LABEL      = 'CDLabel'
+FONT_BOLD_9     = 'CDBold9'
+FONT_BOLD_10    = 'CDBold10'
+FONT_HEADING    = 'CDHeading'
+FONT_HEADING_14 = 'CDHeading14'
+FONT_UI_9       = 'CDUi9'
+FONT_UI_10      = 'CDUi10'
+FONT_ITALIC_9   = 'CDItalic9'
+FONT_MONO_9     = 'CDMono9'
+FONT_MONO_10    = 'CDMono10'
+
+_NAMED_FONTS = {
+    FONT_LABEL: {'family': 'Segoe UI', 'size': 8, 'weight': 'bold'},
+    FONT_BOLD_9: {'family': 'Segoe UI', 'size': 9, 'weight': 'bold'},
+    FONT_BOLD_10: {'family': 'Segoe UI', 'size': 10, 'weight': 'bold'},
+    FONT_HEADING: {'family': 'Segoe UI', 'size': 13, 'weight': 'bold'},
+    FONT_HEADING_14: {'family': 'Segoe UI', 'size': 14, 'weight': 'bold'},
+    FONT_UI_9: {'family': 'Segoe UI', 'size': 9},
+    FONT_UI_10: {'family': 'Segoe UI', 'size': 10},
+    FONT_ITALIC_9: {'family': 'Segoe UI', 'size': 9, 'slant': 'italic'},
+    FONT_MONO_9: {'family': 'Consolas', 'size': 9},
+    FONT_MONO_10: {'family': 'Consolas', 'size': 10},
+}
+
+GRID_COLOR   = '#0D1825'
+GRID_STEP    = 44
+GRID_TILE    = GRID_STEP * 8   # login background tile: 8×8 grid cells
+TREE_ROW_HEIGHT = 28
+DETAIL_ROW_HEIGHT = 22
+ENTRY_ROW_HEIGHT = 26
+# ──────────────────────────────────────────────────────────────────────────────
 
-def apply_dark_theme(style: ttk.Style):
-    """Configure ttk styles for the dark cyber theme."""
-    style.theme_use('clam')
 
+# ─── ttk style table: (style name, configure options, map options) ──────────
+_STYLE_SPEC = (
     # ── Base frames & labels
-    style.configure('TFrame',        background=BG_ROOT)
-    style.configure('TLabel',        background=BG_ROOT, foreground=TEXT_PRI,  font=FONT_UI)
-    style.configure('Title.TLabel',  background=BG_ROOT, foreground=ACCENT,    font=FONT_TITLE)
-    style.configure('Sub.TLabel',    background=BG_ROOT, foreground=ACCENT,    font=FONT_SUB)
-    style.configure('Muted.TLabel',  background=BG_ROOT, foreground=TEXT_SEC,  font=FONT_SMALL)
-    style.configure('Card.TLabel',   background=BG_CARD, foreground=TEXT_PRI,  font=FONT_UI)
-    style.configure('Mono.TLabel',   background=BG_CARD, foreground=ACCENT,    font=FONT_MONO)
+    ('TFrame',        {'background': BG_ROOT}, None),
+    ('TLabel',        {'background': BG_ROOT, 'foreground': TEXT_PRI, 'font': FONT_UI}, None),
+    ('Title.TLabel',  {'background': BG_ROOT, 'foreground': ACCENT,   'font': FONT_TITLE}, None),
+    ('Sub.TLabel',    {'background': BG_ROOT, 'foreground': ACCENT,   'font': FONT_SUB}, None),
+    ('Muted.TLabel',  {'background': BG_ROOT, 'foreground': TEXT_SEC, 'font': FONT_SMALL}, None),
+    ('Card.TLabel',   {'background': BG_CARD, 'foreground': TEXT_PRI, 'font': FONT_UI}, None),
+    ('Mono.TLabel',   {'background': BG_CARD, 'foreground': ACCENT,   'font': FONT_MONO}, None),
 
     # ── Card frame
-    style.configure('Card.TFrame',   background=BG_CARD)
-    style.configure('Elevated.TFrame', background=BG_ELEVATED)
-    style.configure('Input.TFrame',  background=BG_INPUT)
+    ('Card.TFrame',     {'background': BG_CARD}, None),
+    ('Elevated.TFrame', {'background': BG_ELEVATED}, None),
+    ('Input.TFrame',    {'background': BG_INPUT}, None),
 
     # ── Separator
-    style.configure('TSeparator', background=BORDER_ACC)
+    ('TSeparator', {'background': BORDER_ACC}, None),
 
     # ── LabelFrame
-    style.configure('TLabelframe',
-                    background=BG_CARD,
-                    foreground=ACCENT,
-                    font=('Segoe UI', 9, 'bold'),
-                    bordercolor=BORDER_ACC,
-                    relief='solid',
-                    borderwidth=1)
-    style.configure('TLabelframe.Label',
-                    background=BG_CARD,
-                    foreground=ACCENT,
-                    font=('Segoe UI', 9, 'bold'))
+    ('TLabelframe',
+     {'background': BG_CARD,
+      'foreground': ACCENT,
+      'font': ('Segoe UI', 9, 'bold'),
+      'bordercolor': BORDER_ACC,
+      'relief': 'solid',
+      'borderwidth': 1},
+     None),
+    ('TLabelframe.Label',
+     {'background': BG_CARD,
+      'foreground': ACCENT,
+      'font': ('Segoe UI', 9, 'bold')},
+     None),
 
     # ── Entry
-    style.configure('TEntry',
-                    fieldbackground=BG_INPUT,
-                    foreground=TEXT_PRI,
-                    insertcolor=ACCENT,
-                    bordercolor=BORDER_ACC,
-                    lightcolor=BORDER_ACC,
-                    darkcolor=BORDER_ACC,
-                    relief='flat',
-                    padding=6)
-    style.map('TEntry',
-              bordercolor=[('focus', BORDER_HI), ('!focus', BORDER_ACC)],
-              lightcolor=[('focus', BORDER_HI), ('!focus', BORDER_ACC)],
-              darkcolor=[('focus', BORDER_HI),  ('!focus', BORDER_ACC)])
+    ('TEntry',
+     {'fieldbackground': BG_INPUT,
+      'foreground': TEXT_PRI,
+      'insertcolor': ACCENT,
+      'bordercolor': BORDER_ACC,
+      'lightcolor': BORDER_ACC,
+      'darkcolor': BORDER_ACC,
+      'relief': 'flat',
+      'padding': 6},
+     {'bordercolor': [('focus', BORDER_HI), ('!focus', BORDER_ACC)],
+      'lightcolor':  [('focus', BORDER_HI), ('!focus', BORDER_ACC)],
+      'darkcolor':   [('focus', BORDER_HI), ('!focus', BORDER_ACC)]}),
 
     # ── Button base
-    style.configure('TButton',
-                    background=BG_ELEVATED,
-                    foreground=TEXT_SEC,
-                    font=FONT_UI,
-                    bordercolor=BORDER_ACC,
-                    lightcolor=BORDER_ACC,
-                    darkcolor=BORDER_ACC,
-                    relief='flat',
-                    padding=(10, 6))
-    style.map('TButton',
-              background=[('active', BG_HOVER), ('pressed', BG_SEL)],
-              foreground=[('active', TEXT_PRI), ('pressed', TEXT_PRI)],
-              bordercolor=[('active', ACCENT_DIM)])
+    ('TButton',
+     {'background': BG_ELEVATED,
+      'foreground': TEXT_SEC,
+      'font': FONT_UI,
+      'bordercolor': BORDER_ACC,
+      'lightcolor': BORDER_ACC,
+      'darkcolor': BORDER_ACC,
+      'relief': 'flat',
+      'padding': (10, 6)},
+     {'background':  [('active', BG_HOVER), ('pressed', BG_SEL)],
+      'foreground':  [('active', TEXT_PRI), ('pressed', TEXT_PRI)],
+      'bordercolor': [('active', ACCENT_DIM)]}),
 
     # ── Action / Primary button
-    style.configure('Action.TButton',
-                    background=ACCENT_MUTED,
-                    foreground=ACCENT,
-                    font=('Segoe UI', 10, 'bold'),
-                    bordercolor=ACCENT_DIM,
-                    lightcolor=ACCENT_DIM,
-                    darkcolor=ACCENT_DIM,
-                    relief='flat',
-                    padding=(12, 7))
-    style.map('Action.TButton',
-              background=[('active', '#1A3A55'), ('pressed', '#0F2A3F')],
-              foreground=[('active', ACCENT_GLOW), ('pressed', ACCENT_GLOW)],
-              bordercolor=[('active', ACCENT)])
+    ('Action.TButton',
+     {'background': ACCENT_MUTED,
+      'foreground': ACCENT,
+      'font': ('Segoe UI', 10, 'bold'),
+      'bordercolor': ACCENT_DIM,
+      'lightcolor': ACCENT_DIM,
+      'darkcolor': ACCENT_DIM,
+      'relief': 'flat',
+      'padding': (12, 7)},
+     {'background':  [('active', '#1A3A55'), ('pressed', '#0F2A3F')],
+      'foreground':  [('active', ACCENT_GLOW), ('pressed', ACCENT_GLOW)],
+      'bordercolor': [('active', ACCENT)]}),
 
     # ── Danger button
-    style.configure('Danger.TButton',
-                    background='#1A0A0E',
-                    foreground=RED,
-                    font=('Segoe UI', 10, 'bold'),
-                    bordercolor='#4A1520',
-                    lightcolor='#4A1520',
-                    darkcolor='#4A1520',
-                    relief='flat',
-                    padding=(12, 7))
-    style.map('Danger.TButton',
-              background=[('active', RED_DIM), ('pressed', '#5A1020')],
-              foreground=[('active', '#FF6677')])
+    ('Danger.TButton',
+     {'background': '#1A0A0E',
+      'foreground': RED,
+      'font': ('Segoe UI', 10, 'bold'),
+      'bordercolor': '#4A1520',
+      'lightcolor': '#4A1520',
+      'darkcolor': '#4A1520',
+      'relief': 'flat',
+      'padding': (12, 7)},
+     {'background': [('active', RED_DIM), ('pressed', '#5A1020')],
+      'foreground': [('active', '#FF6677')]}),
 
     # ── Notebook (tabs)
-    style.configure('TNotebook',
-                    background=BG_CARD,
-                    tabmargins=[2, 5, 2, 0],
-                    bordercolor=BORDER)
-    style.configure('TNotebook.Tab',
-                    background=BG_ELEVATED,
-                    foreground=TEXT_SEC,
-                    font=FONT_UI,
-                    padding=[12, 6],
-                    bordercolor=BORDER)
-    style.map('TNotebook.Tab',
-              background=[('selected', BG_CARD), ('active', BG_HOVER)],
-              foreground=[('selected', ACCENT), ('active', TEXT_PRI)])
+    ('TNotebook',
+     {'background': BG_CARD,
+      'tabmargins': [2, 5, 2, 0],
+      'bordercolor': BORDER},
+     None),
+    ('TNotebook.Tab',
+     {'background': BG_ELEVATED,
+      'foreground': TEXT_SEC,
+      'font': FONT_UI,
+      'padding': [12, 6],
+      'bordercolor': BORDER},
+     {'background': [('selected', BG_CARD), ('active', BG_HOVER)],
+      'foreground': [('selected', ACCENT), ('active', TEXT_PRI)]}),
 
     # ── Scrollbar
-    style.configure('TScrollbar',
-                    background=BG_ELEVATED,
-                    troughcolor=BG_INPUT,
-                    bordercolor=BORDER,
-                    arrowcolor=TEXT_MUTED,
-                    relief='flat')
-    style.map('TScrollbar',
-              background=[('active', ACCENT_DIM), ('pressed', ACCENT)])
+    ('TScrollbar',
+     {'background': BG_ELEVATED,
+      'troughcolor': BG_INPUT,
+      'bordercolor': BORDER,
+      'arrowcolor': TEXT_MUTED,
+      'relief': 'flat'},
+     {'background': [('active', ACCENT_DIM), ('pressed', ACCENT)]}),
 
     # ── Treeview
-    style.configure('Treeview',
-                    background=BG_INPUT,
-                    foreground=TEXT_PRI,
-                    fieldbackground=BG_INPUT,
-                    font=FONT_MONO,
-                    rowheight=28,
-                    bordercolor=BORDER,
-                    relief='flat')
-    style.configure('Treeview.Heading',
-                    background=BG_ELEVATED,
-                    foreground=ACCENT,
-                    font=('Segoe UI', 9, 'bold'),
-                    relief='flat',
-                    bordercolor=BORDER_ACC)
-    style.map('Treeview',
-              background=[('selected', BG_SEL)],
-              foreground=[('selected', ACCENT)])
+    ('Treeview',
+     {'background': BG_INPUT,
+      'foreground': TEXT_PRI,
+      'fieldbackground': BG_INPUT,
+      'font': FONT_MONO,
+      'rowheight': TREE_ROW_HEIGHT,
+      'bordercolor': BORDER,
+      'relief': 'flat'},
+     {'background': [('selected', BG_SEL)],
+      'foreground': [('selected', ACCENT)]}),
+    ('Details.Treeview',
+     {'background': BG_ELEVATED,
+      'foreground': TEXT_PRI,
+      'fieldbackground': BG_ELEVATED,
+      'font': FONT_MONO,
+      'rowheight': DETAIL_ROW_HEIGHT,
+      'borderwidth': 0,
+      'relief': 'flat'},
+     None),
+    ('Entries.Treeview',
+     {'background': BG_CARD,
+      'foreground': TEXT_PRI,
+      'fieldbackground': BG_CARD,
+      'font': FONT_UI,
+      'rowheight': ENTRY_ROW_HEIGHT,
+      'borderwidth': 0,
+      'relief': 'flat'},
+     None),
+    ('Treeview.Heading',
+     {'background': BG_ELEVATED,
+      'foreground': ACCENT,
+      'font': ('Segoe UI', 9, 'bold'),
+      'relief': 'flat',
+      'bordercolor': BORDER_ACC},
+     None),
 
     # ── PanedWindow
-    style.configure('TPanedwindow', background=BG_ROOT)
-    style.configure('Sash', sashthickness=4, background=BORDER_ACC)
+    ('TPanedwindow', {'background': BG_ROOT}, None),
+    ('Sash',         {'sashthickness': 4, 'background': BORDER_ACC}, None),
+)
 
 
+def apply_dark_theme(style: ttk.Style):
+    """Configure ttk styles for the dark cyber theme (no-op if already applied)."""
+    # Styles live in the Tcl interpreter, so check there rather than with a
+    # module flag: a second tk.Tk() in the same process still gets themed.
+    if style.theme_use() == 'clam' and style.lookup('Action.TButton', 'background'):
+        return
+    style.theme_use('clam')
+
+    configure, style_map = style.configure, style.map
+    for name, cfg, mp in _STYLE_SPEC:
+        configure(name, **cfg)
+        if mp:
+            style_map(name, **mp)
+
+
+def create_named_fonts(root):
+    """Create the named fonts for root; returns the Font objects, which must be kept alive."""
+    existing = set(tkfont.names(root))
+    return [tkfont.Font(root=root, name=name, **options)
+            for name, options in _NAMED_FONTS.items() if name not in existing]
+
+
+@lru_cache(maxsize=128)
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
+# Shared widget options for the dark_* helpers (read-only; callers override via kwargs)
+_DARK_ENTRY_KW = {
+    'bg': BG_INPUT,
+    'fg': TEXT_PRI,
+    'insertbackground': ACCENT,
+    'selectbackground': BG_SEL,
+    'selectforeground': ACCENT,
+    'relief': 'flat',
+    'highlightthickness': 1,
+    'highlightcolor': ACCENT,
+    'highlightbackground': BORDER_ACC,
+}
+_DARK_TEXT_KW = dict(_DARK_ENTRY_KW, padx=8, pady=8)
+_DARK_TEXT_VBAR_KW = {
+    'bg': BG_ELEVATED,
+    'troughcolor': BG_INPUT,
+    'activebackground': ACCENT_DIM,
+    'highlightthickness': 0,
+}
+_DARK_LISTBOX_KW = {
+    'bg': BG_INPUT,
+    'fg': TEXT_PRI,
+    'selectbackground': BG_SEL,
+    'selectforeground': ACCENT,
+    'activestyle': 'none',
+    'relief': 'flat',
+    'highlightthickness': 1,
+    'highlightcolor': ACCENT,
+    'highlightbackground': BORDER_ACC,
+}
+
+
 def dark_entry(parent, **kwargs):
     """A consistently dark-styled Entry widget."""
-    e = tk.Entry(parent,
-                 bg=BG_INPUT,
-                 fg=TEXT_PRI,
-                 insertbackground=ACCENT,
-                 selectbackground=BG_SEL,
-                 selectforeground=ACCENT,
-                 relief='flat',
-                 highlightthickness=1,
-                 highlightcolor=ACCENT,
-                 highlightbackground=BORDER_ACC,
-                 **kwargs)
-    return e
+    return tk.Entry(parent, **{**_DARK_ENTRY_KW, **kwargs})
 
 
 def dark_text(parent, **kwargs):
     """A consistently dark-styled Text / ScrolledText widget."""
-    t = scrolledtext.ScrolledText(parent,
-                                   bg=BG_INPUT,
-                                   fg=TEXT_PRI,
-                                   insertbackground=ACCENT,
-                                   selectbackground=BG_SEL,
-                                   selectforeground=ACCENT,
-                                   relief='flat',
-                                   highlightthickness=1,
-                                   highlightcolor=ACCENT,
-                                   highlightbackground=BORDER_ACC,
-                                   padx=8, pady=8,
-                                   **kwargs)
+    t = scrolledtext.ScrolledText(parent, **{**_DARK_TEXT_KW, **kwargs})
     # Style the scrollbar inside ScrolledText
-    t.vbar.configure(bg=BG_ELEVATED, troughcolor=BG_INPUT,
-                     activebackground=ACCENT_DIM, highlightthickness=0)
+    t.vbar.configure(**_DARK_TEXT_VBAR_KW)
     return t
 
 
 def dark_listbox(parent, **kwargs):
-    lb = tk.Listbox(parent,
-                    bg=BG_INPUT,
-                    fg=TEXT_PRI,
-                    selectbackground=BG_SEL,
-                    selectforeground=ACCENT,
-                    activestyle='none',
-                    relief='flat',
-                    highlightthickness=1,
-                    highlightcolor=ACCENT,
-                    highlightbackground=BORDER_ACC,
-                    **kwargs)
-    return lb
+    return tk.Listbox(parent, **{**_DARK_LISTBOX_KW, **kwargs})
+
+
+def details_tree(parent, rows, key_width=150):
+    """
+    Key/value grid as a single Treeview rather than two Labels per row.
+    Each row is (label, value) or (label, value, tag) with tag 'good'/'bad'.
+    """
+    tree = ttk.Treeview(parent, columns=('k', 'v'), show='',
+                        height=len(rows), style='Details.Treeview',
+                        selectmode='none', takefocus=False)
+    tree.column('k', width=key_width, stretch=False, anchor='w')
+    tree.column('v', width=320, stretch=True, anchor='w')
+    tree.tag_configure('good', foreground=GREEN)
+    tree.tag_configure('bad', foreground=RED)
+    for row in rows:
+        tree.insert('', 'end', values=row[:2], tags=row[2:])
+    return tree
 
 
 def separator(parent, orient='horizontal', color=BORDER_ACC, thickness=1):
@@ -254,17 +343,160 @@ def separator(parent, orient='horizontal', color=BORDER_ACC, thickness=1):
     return f
 
 
-def section_label(parent, text, **kwargs):
-    """Uppercase section label in accent color."""
+@lru_cache(maxsize=64)
+def _detail_label(key):
+    """'key_size' -> 'Key Size:' for the certificate / public key grids."""
+    return f"{key.replace('_', ' ').title()}:"
+
+
+def section_label(parent, text, *, upper=True, **kwargs):
+    """Uppercase section label in accent color (pass upper=False for pre-cased text)."""
     lbl = tk.Label(parent,
-                   text=text.upper(),
+                   text=text.upper() if upper else text,
                    bg=parent.cget('bg') if hasattr(parent, 'cget') else BG_CARD,
                    fg=ACCENT,
-                   font=('Segoe UI', 8, 'bold'),
+                   font=FONT_LABEL,
                    **kwargs)
     return lbl
 
 
+class VirtualRows:
+    """
+    Show a long list in a ttk.Treeview while only keeping the visible
+    window of rows inserted. The scrollbar is driven from the model, so
+    a list of any length costs one screenful of tree items.
+    """
+
+    def __init__(self, tree, scrollbar, rows=(), format_row=tuple,
+                 row_height=TREE_ROW_HEIGHT, stripe=False):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows = rows
+        self.format_row = format_row
+        self.row_height = row_height
+        self.stripe = stripe    # tag every other model row 'odd'
+        self.first = 0
+        # One row's worth of height goes to the column headings, if shown
+        self._header_rows = 1 if 'headings' in str(tree.cget('show')) else 0
+        scrollbar.configure(command=self.yview)
+        tree.bind('<Configure>', self.render, add='+')
+        tree.bind('<MouseWheel>', self._on_wheel, add='+')
+        tree.bind('<Button-4>', lambda e: self.scroll(-3), add='+')
+        tree.bind('<Button-5>', lambda e: self.scroll(3), add='+')
+        # Keyboard navigation has to move through the model, not the pooled items
+        for key, step in (('<Up>', -1), ('<Down>', 1), ('<Prior>', 'page_up'),
+                          ('<Next>', 'page_down'), ('<Home>', 'home'), ('<End>', 'end')):
+            tree.bind(key, lambda e, step=step: self._on_key(step))
+        self.render()
+
+    def visible_count(self):
+        return max(1, self.tree.winfo_height() // self.row_height - self._header_rows)
+
+    def set_rows(self, rows):
+        self.rows = rows
+        self.first = 0
+        if self.tree.selection():
+            self.tree.selection_remove(self.tree.selection())
+        self.render()
+
+    def render(self, event=None):
+        """Refill the pooled tree items with the rows at the current offset."""
+        tree  = self.tree
+        count = self.visible_count()
+        total = len(self.rows)
+        self.first = max(0, min(self.first, total - count))
+        window = [self.format_row(row) for row in self.rows[self.first:self.first + count]]
+
+        tags = [('odd',) if self.stripe and (self.first + i) % 2 else ()
+                for i in range(len(window))]
+        items = tree.get_children()
+        for iid, values, tag in zip(items, window, tags):
+            tree.item(iid, values=values, tags=tag)
+        if len(items) > len(window):
+            tree.delete(*items[len(window):])
+        for values, tag in zip(window[len(items):], tags[len(items):]):
+            tree.insert('', 'end', values=values, tags=tag)
+
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + count) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll(self, step):
+        first = self.first
+        self.first += step
+        self.render()
+        if self.first != first and self.tree.selection():
+            # The pooled items now hold other rows
+            self.tree.selection_remove(self.tree.selection())
+
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'|'pages')."""
+        if args[0] == 'moveto':
+            self.scroll(int(float(args[1]) * len(self.rows)) - self.first)
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self.visible_count()
+            self.scroll(step)
+
+    def _on_wheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
+        return 'break'
+
+    def _on_key(self, step):
+        total = len(self.rows)
+        if not total:
+            return 'break'
+        count = self.visible_count()
+        current = self.tree.focus() or next(iter(self.tree.selection()), '')
+        index = self.index_of(current) if current else self.first - 1
+        if step == 'home':
+            target = 0
+        elif step == 'end':
+            target = total - 1
+        else:
+            if step in ('page_up', 'page_down'):
+                step = count if step == 'page_down' else -count
+            target = max(0, min(total - 1, index + step))
+
+        # Bring the target row into the window, then select its pooled item
+        if target < self.first:
+            self.scroll(target - self.first)
+        elif target >= self.first + count:
+            self.scroll(target - self.first - count + 1)
+        iid = self.tree.get_children()[target - self.first]
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        return 'break'
+
+    def index_of(self, iid):
+        """Model index of the row currently shown in tree item `iid`."""
+        return self.first + self.tree.index(iid)
+
+
+def _validate_registration(username, password, confirm):
+    """Local registration checks; returns an error message or None."""
+    if not username:
+        return "Username is required"
+    if len(username) < 3:
+        return "Username must be at least 3 characters"
+    if not password:
+        return "Password is required"
+    if len(password) < 6:
+        return "Password must be at least 6 characters"
+    if password != confirm:
+        return "Passwords do not match"
+    return None
+
+
+def _validate_login(username, password):
+    """Local login checks; returns an error message or None."""
+    if not username or not password:
+        return "Please enter username and password"
+    return None
+
+
 class CryptDiaryApp:
     """Main application class for CryptDiary (Multi-User) — Dark Edition"""
 
@@ -283,12 +515,6 @@ class CryptDiaryApp:
             # Linux (X11) – use attributes
             self.root.attributes('-zoomed', True)
 
-        # ── Icon-ish window colour
-        try:
-            self.root.wm_attributes('-transparentcolor', '')
-        except Exception:
-            pass
-
         # Initialize managers
         self.user_manager  = UserManager()
         self.key_manager   = None
@@ -299,45 +525,119 @@ class CryptDiaryApp:
         self.current_user     = None
         self.current_entry_id = None
         self.is_authenticated  = False
+        self._search_after_id  = None
+        self._grid_tile        = None   # keep a reference so Tk doesn't drop the image
+        self._cert_viewer      = None   # hidden, not destroyed, between opens
+        self._cert_viewer_reopen = None  # rebuilds the viewer's stale parts on reuse
+        self._last_query       = None   # query the entry list was last built for
+        self._entries_dirty    = True   # entries changed since the last build
+        self._screens          = {}     # built top-level screen frames, re-packed on revisit
+        self._users_display_cache = None   # rendered "Registered Users" text
+        self._io_pool          = None   # worker threads for verify/decrypt, made on first use
+        self._load_seq         = 0      # bumped per load_entry; stale results are dropped
+        self._user_info_cache  = {}     # username -> get_user_info() record
 
         self.style = ttk.Style()
         apply_dark_theme(self.style)
+        self._fonts = create_named_fonts(self.root)
 
         self.show_login_screen()
+        self.root.after_idle(self._preload_session_modules)
+        self.root.after_idle(self._prebuild_screens)
+
+    def _prebuild_screens(self):
+        """Build the registration screen off-screen while the app is idle."""
+        if 'register' not in self._screens:
+            self._build_registration_screen()
+
+    def _preload_session_modules(self):
+        """Import the session modules in the background once the login screen is up."""
+        def load():
+            for name in ('key_manager', 'crypto_manager', 'diary_storage'):
+                importlib.import_module(name)
+        threading.Thread(target=load, daemon=True).start()
 
     def clear_window(self):
+        """Hide the cached screens and destroy everything else (e.g. open dialogs)."""
+        # Hidden screens outlive the session; don't leave passwords in them
+        self._clear_password_fields()
+        screens = set(self._screens.values())
         for widget in self.root.winfo_children():
-            widget.destroy()
+            if widget in screens:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+
+    def _clear_password_fields(self):
+        for name in ('password_entry', 'reg_password', 'reg_confirm'):
+            entry = getattr(self, name, None)
+            if entry is not None:
+                entry.delete(0, tk.END)
+
+    def _show_cached_screen(self, name):
+        """Re-pack a previously built screen; returns False if it was never built."""
+        self.clear_window()
+        frame = self._screens.get(name)
+        if frame is None:
+            return False
+        frame.pack(fill=tk.BOTH, expand=True)
+        return True
+
+    def _get_user_info(self, username):
+        """User record, read from the user manager once until it is changed."""
+        info = self._user_info_cache.get(username)
+        if info is None:
+            info = self._user_info_cache[username] = self.user_manager.get_user_info(username)
+        return info
+
+    def _get_grid_tile(self):
+        """Pre-rendered grid-line tile for the login background, built once."""
+        if self._grid_tile is None:
+            tile = tk.PhotoImage(width=GRID_TILE, height=GRID_TILE)
+            for off in range(0, GRID_TILE, GRID_STEP):
+                tile.put(GRID_COLOR, to=(off, 0, off + 1, GRID_TILE))
+                tile.put(GRID_COLOR, to=(0, off, GRID_TILE, off + 1))
+            self._grid_tile = tile
+        return self._grid_tile
 
     # ─────────────────────────────────────────────────────────────────────────
     # LOGIN / REGISTRATION
     # ─────────────────────────────────────────────────────────────────────────
     def show_login_screen(self):
-        self.clear_window()
+        if self._show_cached_screen('login'):
+            self.username_entry.delete(0, tk.END)
+            self.password_entry.delete(0, tk.END)
+            self.username_entry.focus()
+            return
 
         # Full-window canvas background with subtle grid lines
         canvas = tk.Canvas(self.root, bg=BG_ROOT, highlightthickness=0)
         canvas.pack(fill=tk.BOTH, expand=True)
+        self._screens['login'] = canvas
+
+        tile = self._get_grid_tile()
+        tile_ids = []
 
         def draw_bg(event=None):
-            canvas.delete('bg_grid')
+            # Reuse the tile items across resizes; only create or hide the delta
             w, h = canvas.winfo_width(), canvas.winfo_height()
-            step = 44
-            for x in range(0, w, step):
-                canvas.create_line(x, 0, x, h, fill='#0D1825', tags='bg_grid')
-            for y in range(0, h, step):
-                canvas.create_line(0, y, w, y, fill='#0D1825', tags='bg_grid')
+            positions = [(x, y) for x in range(0, w, GRID_TILE) for y in range(0, h, GRID_TILE)]
+            while len(tile_ids) < len(positions):
+                tile_ids.append(canvas.create_image(0, 0, image=tile, anchor='nw', tags='bg_grid'))
+            for item, (x, y) in zip(tile_ids, positions):
+                canvas.coords(item, x, y)
+                canvas.itemconfigure(item, state='normal')
+            for item in tile_ids[len(positions):]:
+                canvas.itemconfigure(item, state='hidden')
             canvas.tag_lower('bg_grid')
 
-        canvas.bind('<Configure>', draw_bg)
-
         # ── Centre card
         card_width = 440
         card = tk.Frame(canvas, bg=BG_CARD, relief='flat', bd=0)
-        canvas.create_window(500, 360, window=card, width=card_width)
+        card_win_id = canvas.create_window(500, 360, window=card, width=card_width)
         canvas.bind('<Configure>', lambda e: (
             draw_bg(e),
-            canvas.coords(canvas.find_all()[-1], e.width // 2, e.height // 2)
+            canvas.coords(card_win_id, e.width // 2, e.height // 2)
         ))
 
         # Top accent strip
@@ -358,7 +658,7 @@ class CryptDiaryApp:
 
         tk.Label(inner,
                  text='Secure · Encrypted · Signed',
-                 font=('Consolas', 10),
+                 font=FONT_MONO_10,
                  bg=BG_CARD, fg=TEXT_SEC).pack(pady=(0, 25))
 
         separator(inner, color=BORDER_ACC)
@@ -378,8 +678,9 @@ class CryptDiaryApp:
         btn_row = tk.Frame(inner, bg=BG_CARD)
         btn_row.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Button(btn_row, text='  Login  ', command=self.login,
-                   style='Action.TButton', width=12).pack(side=tk.LEFT, padx=(0, 8))
+        self._login_btn = ttk.Button(btn_row, text='  Login  ', command=self.login,
+                                     style='Action.TButton', width=12)
+        self._login_btn.pack(side=tk.LEFT, padx=(0, 8))
 
         ttk.Button(btn_row, text='Register', command=self.show_registration_screen,
                    style='TButton', width=10).pack(side=tk.LEFT, padx=(0, 8))
@@ -399,10 +700,18 @@ class CryptDiaryApp:
         self.username_entry.focus()
 
     def show_registration_screen(self):
-        self.clear_window()
+        if 'register' not in self._screens:
+            self._build_registration_screen()
+        self._show_cached_screen('register')
+        for e in (self.reg_username, self.reg_fullname,
+                  self.reg_password, self.reg_confirm):
+            e.delete(0, tk.END)
+        self.reg_username.focus()
 
+    def _build_registration_screen(self):
+        """Build the registration screen frame (unpacked) and cache it."""
         outer = tk.Frame(self.root, bg=BG_ROOT)
-        outer.pack(fill=tk.BOTH, expand=True)
+        self._screens['register'] = outer
 
         # Back button row (title centered)
         nav = tk.Frame(outer, bg=BG_ROOT, padx=20, pady=14)
@@ -410,7 +719,7 @@ class CryptDiaryApp:
         ttk.Button(nav, text='← Back', command=self.show_login_screen,
                    style='TButton', width=8).pack(side=tk.LEFT)
         tk.Label(nav, text='Register New Account',
-                 font=('Segoe UI', 13, 'bold'),
+                 font=FONT_HEADING,
                  bg=BG_ROOT, fg=TEXT_PRI).pack(side=tk.LEFT, expand=True, anchor='center')
 
         # Card
@@ -445,28 +754,24 @@ class CryptDiaryApp:
         ttk.Button(btn_row, text='Cancel', command=self.show_login_screen,
                    style='TButton', width=10).pack(side=tk.LEFT)
 
-        self.reg_username.focus()
-
     def register_user(self):
         username = self.reg_username.get().strip()
         fullname = self.reg_fullname.get().strip()
         password = self.reg_password.get()
         confirm  = self.reg_confirm.get()
 
-        if not username:
-            messagebox.showerror("Error", "Username is required")
-            return
-        if not password:
-            messagebox.showerror("Error", "Password is required")
-            return
-        if password != confirm:
-            messagebox.showerror("Error", "Passwords do not match")
+        error = _validate_registration(username, password, confirm)
+        if error:
+            messagebox.showerror("Error", error)
             return
 
         result = self.user_manager.register_user(
             username=username, password=password, full_name=fullname)
 
         if result is True:
+            self._users_display_cache = None
+            self.reg_password.delete(0, tk.END)
+            self.reg_confirm.delete(0, tk.END)
             messagebox.showinfo(
                 "Account Created",
                 f"User '{username}' registered successfully!\n\n"
@@ -477,20 +782,35 @@ class CryptDiaryApp:
             messagebox.showerror("Registration Failed", result)
 
     def show_user_list(self):
-        users = self.user_manager.list_users()
-        if not users:
-            messagebox.showinfo("Users", "No users registered yet.")
-            return
-        user_list = "\n".join(f"  •  {u}" for u in users)
-        messagebox.showinfo("Registered Users",
-                            f"Total: {len(users)}\n\n{user_list}")
+        if self._users_display_cache is None:
+            users = self.user_manager.list_users()
+            if not users:
+                messagebox.showinfo("Users", "No users registered yet.")
+                return
+            user_list = "\n".join(f"  •  {u}" for u in users)
+            self._users_display_cache = f"Total: {len(users)}\n\n{user_list}"
+        messagebox.showinfo("Registered Users", self._users_display_cache)
 
     def login(self):
+        # Disable the button while keys load; also ignores Enter pressed
+        # again from inside one of the dialogs below
+        if self._login_btn.instate(['disabled']):
+            return
+        self._login_btn.state(['disabled'])
+        self.root.update_idletasks()
+        try:
+            self._login()
+        finally:
+            self._login_btn.state(['!disabled'])
+
+    def _login(self):
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
+        self.password_entry.delete(0, tk.END)
 
-        if not username or not password:
-            messagebox.showerror("Error", "Please enter username and password")
+        error = _validate_login(username, password)
+        if error:
+            messagebox.showerror("Error", error)
             return
 
         user_record = self.user_manager.authenticate_user(username, password)
@@ -500,6 +820,10 @@ class CryptDiaryApp:
                 "Invalid username or password.\n\nPlease try again or register.")
             return
 
+        from key_manager import KeyManager
+        from crypto_manager import CryptoManager
+        from diary_storage import DiaryStorage
+
         user_dir = self.user_manager.get_user_dir(username)
         self.key_manager = KeyManager(user_dir=str(user_dir))
 
@@ -520,10 +844,19 @@ class CryptDiaryApp:
     # MAIN SCREEN
     # ─────────────────────────────────────────────────────────────────────────
     def show_main_screen(self):
-        self.clear_window()
+        if self._show_cached_screen('main'):
+            # Only the per-user parts change between logins
+            self._user_label.config(text=f"  {self.current_user['username']}")
+            self.clear_editor()
+            self.search_var.set('')
+            self._cancel_search_refresh()
+            self._entries_dirty = True
+            self.refresh_entry_list()
+            return
 
         root_frame = tk.Frame(self.root, bg=BG_ROOT)
         root_frame.pack(fill=tk.BOTH, expand=True)
+        self._screens['main'] = root_frame
 
         # ── Top bar ──────────────────────────────────────────────────────────
         topbar = tk.Frame(root_frame, bg='#060A10', height=54)
@@ -536,16 +869,17 @@ class CryptDiaryApp:
         tk.Label(brand, text='🔐', font=('Segoe UI', 18),
                  bg='#060A10', fg=ACCENT).pack(side=tk.LEFT)
         tk.Label(brand, text=' CryptDiary',
-                 font=('Segoe UI', 13, 'bold'),
+                 font=FONT_HEADING,
                  bg='#060A10', fg=TEXT_PRI).pack(side=tk.LEFT)
 
         # Thin vertical divider
         tk.Frame(topbar, bg=BORDER_ACC, width=1).pack(side=tk.LEFT, fill=tk.Y, pady=10)
 
-        tk.Label(topbar,
-                 text=f"  {self.current_user['username']}",
-                 font=('Consolas', 10),
-                 bg='#060A10', fg=TEXT_SEC).pack(side=tk.LEFT, padx=10)
+        self._user_label = tk.Label(topbar,
+                                    text=f"  {self.current_user['username']}",
+                                    font=FONT_MONO_10,
+                                    bg='#060A10', fg=TEXT_SEC)
+        self._user_label.pack(side=tk.LEFT, padx=10)
 
         # Right — action buttons (ttk)
         right_bar = tk.Frame(topbar, bg='#060A10')
@@ -577,7 +911,7 @@ class CryptDiaryApp:
         # Panel header
         panel_head = tk.Frame(left_panel, bg=BG_ELEVATED, pady=10, padx=14)
         panel_head.pack(fill=tk.X)
-        tk.Label(panel_head, text='ENTRIES', font=('Segoe UI', 9, 'bold'),
+        tk.Label(panel_head, text='ENTRIES', font=FONT_BOLD_9,
                  bg=BG_ELEVATED, fg=ACCENT).pack(anchor='w')
 
         # Search
@@ -589,19 +923,19 @@ class CryptDiaryApp:
                               highlightcolor=ACCENT)
         search_row.pack(fill=tk.X)
 
-        tk.Label(search_row, text='🔍', font=('Segoe UI', 10),
+        tk.Label(search_row, text='🔍', font=FONT_UI_10,
                  bg=BG_INPUT, fg=TEXT_MUTED).pack(side=tk.LEFT, padx=6, pady=5)
 
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', lambda *a: self.refresh_entry_list())
+        self.search_var.trace_add('write', self._on_search_changed)
         search_e = tk.Entry(search_row, textvariable=self.search_var,
                             bg=BG_INPUT, fg=TEXT_PRI,
                             insertbackground=ACCENT,
-                            relief='flat', font=('Segoe UI', 10),
+                            relief='flat', font=FONT_UI_10,
                             highlightthickness=0)
         search_e.pack(side=tk.LEFT, fill=tk.X, expand=True, pady=5)
 
-        # Listbox
+        # Entry list: a Treeview that only holds the visible rows
         list_wrap = tk.Frame(left_panel, bg=BG_CARD, padx=8, pady=4)
         list_wrap.pack(fill=tk.BOTH, expand=True)
 
@@ -610,22 +944,21 @@ class CryptDiaryApp:
                           highlightthickness=0, bd=0)
         sb.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.entry_listbox = tk.Listbox(
+        self.entry_tree = ttk.Treeview(
             list_wrap,
-            yscrollcommand=sb.set,
-            bg=BG_CARD,
-            fg=TEXT_PRI,
-            selectbackground=BG_SEL,
-            selectforeground=ACCENT,
-            activestyle='none',
-            relief='flat',
-            highlightthickness=0,
-            font=('Segoe UI', 10),
-            cursor='hand2',
-            borderwidth=0)
-        self.entry_listbox.pack(fill=tk.BOTH, expand=True)
-        sb.config(command=self.entry_listbox.yview)
-        self.entry_listbox.bind('<<ListboxSelect>>', self.on_entry_select)
+            columns=('title',),
+            show='',
+            style='Entries.Treeview',
+            selectmode='browse',
+            cursor='hand2')
+        self.entry_tree.column('title', anchor='w', stretch=True)
+        self.entry_tree.tag_configure('odd', background='#0A0F1A')
+        self.entry_tree.pack(fill=tk.BOTH, expand=True)
+        self._entry_rows = VirtualRows(
+            self.entry_tree, sb, [],
+            lambda entry: (f'  {entry["title"]}',),
+            row_height=ENTRY_ROW_HEIGHT, stripe=True)
+        self.entry_tree.bind('<<TreeviewSelect>>', self.on_entry_select)
 
         # Thin divider between panels
         tk.Frame(content, bg=BORDER_ACC, width=1).pack(side=tk.LEFT, fill=tk.Y)
@@ -641,7 +974,7 @@ class CryptDiaryApp:
         title_row = tk.Frame(editor_wrap, bg=BG_ROOT)
         title_row.pack(fill=tk.X, pady=(0, 12))
 
-        tk.Label(title_row, text='TITLE', font=('Segoe UI', 8, 'bold'),
+        tk.Label(title_row, text='TITLE', font=FONT_LABEL,
                  bg=BG_ROOT, fg=ACCENT).pack(anchor='w', pady=(0, 4))
 
         self.title_entry = tk.Entry(title_row,
@@ -658,7 +991,7 @@ class CryptDiaryApp:
         self.title_entry.pack(fill=tk.X, ipady=9)
 
         # Content label
-        tk.Label(editor_wrap, text='CONTENT', font=('Segoe UI', 8, 'bold'),
+        tk.Label(editor_wrap, text='CONTENT', font=FONT_LABEL,
                  bg=BG_ROOT, fg=ACCENT).pack(anchor='w', pady=(6, 4))
 
         self.content_text = dark_text(editor_wrap,
@@ -671,12 +1004,12 @@ class CryptDiaryApp:
         status_row.pack(fill=tk.X, pady=(8, 0))
 
         self.signature_label = tk.Label(status_row, text='',
-                                         font=('Consolas', 9),
+                                         font=FONT_MONO_9,
                                          bg=BG_ROOT, fg=GREEN)
         self.signature_label.pack(side=tk.LEFT)
 
         self.revocation_label = tk.Label(status_row, text='',
-                                          font=('Consolas', 9),
+                                          font=FONT_MONO_9,
                                           bg=BG_ROOT, fg=GREEN)
         self.revocation_label.pack(side=tk.LEFT, padx=(20, 0))
 
@@ -696,6 +1029,7 @@ class CryptDiaryApp:
         ebtn('↓ Import',   self.import_entry_dialog,    'TButton',       10)
         ebtn('✕ Clear',    self.clear_editor,            'TButton',       9)
 
+        self._entries_dirty = True
         self.refresh_entry_list()
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -706,31 +1040,21 @@ class CryptDiaryApp:
             messagebox.showerror("Error", "No key manager available.")
             return
 
-        win = tk.Toplevel(self.root)
-        win.title(f"Certificates & Keys  ·  {self.current_user['username']}")
-        win.geometry("720x620")
-        win.configure(bg=BG_ROOT)
-        win.transient(self.root)
-        win.grab_set()
-        win.resizable(True, True)
+        # Reuse the viewer built on a previous open
+        if self._cert_viewer is not None and self._cert_viewer.winfo_exists():
+            self._cert_viewer_reopen()
+            self._cert_viewer.deiconify()
+            self._cert_viewer.lift()
+            self._cert_viewer.grab_set()
+            return
 
-        tk.Frame(win, bg=ACCENT, height=3).pack(fill=tk.X)
-
-        # Header
-        header = tk.Frame(win, bg='#060A10', padx=20, pady=14)
-        header.pack(fill=tk.X)
-        tk.Label(header, text='🔐  Cryptographic Materials',
-                 font=('Segoe UI', 14, 'bold'),
-                 bg='#060A10', fg=TEXT_PRI).pack(side=tk.LEFT)
-        tk.Label(header, text=f"  /  {self.current_user['username']}",
-                 font=('Consolas', 10),
-                 bg='#060A10', fg=TEXT_SEC).pack(side=tk.LEFT)
-        tk.Frame(win, bg=BORDER_ACC, height=1).pack(fill=tk.X)
+        username = self.current_user['username']
+        win, nb_frame = self._make_modal(
+            f"Certificates & Keys  ·  {username}", "720x620",
+            '🔐  Cryptographic Materials', subtitle=f"  /  {username}",
+            banner=True, padding=(15, 10), resizable=True)
 
         # Notebook
-        nb_frame = tk.Frame(win, bg=BG_ROOT, padx=15, pady=10)
-        nb_frame.pack(fill=tk.BOTH, expand=True)
-
         notebook = ttk.Notebook(nb_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
 
@@ -748,238 +1072,324 @@ class CryptDiaryApp:
         notebook.add(privkey_frame, text='⚫  Private Key')
         notebook.add(revoke_frame,  text='🚫  Revocation')
 
+        reset_private_view = None   # set once the private key tab is built
+
         # ── Certificate Tab ───────────────────────────────────────────────────
-        if self.key_manager.certificate:
-            cert_details = self.key_manager.get_certificate_details()
-            cert_pem     = self.key_manager.export_certificate_pem()
-
-            grid_frame = tk.Frame(cert_frame, bg=BG_ELEVATED,
-                                  padx=14, pady=12,
-                                  relief='flat',
-                                  highlightthickness=1,
-                                  highlightbackground=BORDER_ACC)
-            grid_frame.pack(fill=tk.X, pady=(0, 10))
-
-            tk.Label(grid_frame, text='CERTIFICATE INFORMATION',
-                     font=('Segoe UI', 8, 'bold'),
-                     bg=BG_ELEVATED, fg=ACCENT).grid(
-                row=0, column=0, columnspan=2, sticky='w', pady=(0, 8))
-
-            for i, (k, v) in enumerate(cert_details.items(), start=1):
-                tk.Label(grid_frame, text=f"{k.replace('_', ' ').title()}:",
-                         font=('Segoe UI', 9, 'bold'),
-                         bg=BG_ELEVATED, fg=TEXT_SEC).grid(
-                    row=i, column=0, sticky='w', pady=3, padx=(0, 14))
-                tk.Label(grid_frame, text=str(v),
-                         font=('Consolas', 9),
-                         bg=BG_ELEVATED, fg=TEXT_PRI).grid(
-                    row=i, column=1, sticky='w', pady=3)
-
-            self._pem_block(cert_frame, cert_pem, 'CERTIFICATE PEM', 'Certificate')
-        else:
-            tk.Label(cert_frame, text='No certificate available',
-                     font=FONT_UI, bg=BG_CARD, fg=TEXT_SEC).pack(pady=30)
+        def build_cert_tab():
+            if self.key_manager.certificate:
+                cert_details = self.key_manager.get_certificate_details()
+                cert_pem     = self.key_manager.export_certificate_pem()
+
+                grid_frame = tk.Frame(cert_frame, bg=BG_ELEVATED,
+                                      padx=14, pady=12,
+                                      relief='flat',
+                                      highlightthickness=1,
+                                      highlightbackground=BORDER_ACC)
+                grid_frame.pack(fill=tk.X, pady=(0, 10))
+
+                tk.Label(grid_frame, text='CERTIFICATE INFORMATION',
+                         font=FONT_LABEL,
+                         bg=BG_ELEVATED, fg=ACCENT).grid(
+                    row=0, column=0, columnspan=2, sticky='w', pady=(0, 8))
+
+                details_tree(grid_frame,
+                             [(_detail_label(k), str(v)) for k, v in cert_details.items()]
+                             ).grid(row=1, column=0, columnspan=2, sticky='ew')
+
+                self._pem_block(cert_frame, cert_pem, 'CERTIFICATE PEM', 'Certificate')
+            else:
+                tk.Label(cert_frame, text='No certificate available',
+                         font=FONT_UI, bg=BG_CARD, fg=TEXT_SEC).pack(pady=30)
 
         # ── Public Key Tab ────────────────────────────────────────────────────
-        if self.key_manager.public_key:
-            pubkey_details = self.key_manager.get_public_key_details()
-            pubkey_pem     = self.key_manager.export_public_key_pem()
-
-            grid_frame = tk.Frame(pubkey_frame, bg=BG_ELEVATED,
-                                  padx=14, pady=12,
-                                  highlightthickness=1,
-                                  highlightbackground=BORDER_ACC)
-            grid_frame.pack(fill=tk.X, pady=(0, 10))
-
-            tk.Label(grid_frame, text='PUBLIC KEY INFORMATION',
-                     font=('Segoe UI', 8, 'bold'),
-                     bg=BG_ELEVATED, fg=ACCENT).grid(
-                row=0, column=0, columnspan=2, sticky='w', pady=(0, 8))
-
-            for i, (k, v) in enumerate(
-                    {kk: vv for kk, vv in pubkey_details.items() if kk != 'pem'}.items(),
-                    start=1):
-                tk.Label(grid_frame, text=f"{k.replace('_', ' ').title()}:",
-                         font=('Segoe UI', 9, 'bold'),
-                         bg=BG_ELEVATED, fg=TEXT_SEC).grid(
-                    row=i, column=0, sticky='w', pady=3, padx=(0, 14))
-                tk.Label(grid_frame, text=str(v),
-                         font=('Consolas', 9),
-                         bg=BG_ELEVATED, fg=TEXT_PRI).grid(
-                    row=i, column=1, sticky='w', pady=3)
-
-            self._pem_block(pubkey_frame, pubkey_pem, 'PUBLIC KEY PEM', 'Public Key')
-        else:
-            tk.Label(pubkey_frame, text='No public key available',
-                     font=FONT_UI, bg=BG_CARD, fg=TEXT_SEC).pack(pady=30)
+        def build_pubkey_tab():
+            if self.key_manager.public_key:
+                pubkey_details = self.key_manager.get_public_key_details()
+                pubkey_pem     = self.key_manager.export_public_key_pem()
+
+                grid_frame = tk.Frame(pubkey_frame, bg=BG_ELEVATED,
+                                      padx=14, pady=12,
+                                      highlightthickness=1,
+                                      highlightbackground=BORDER_ACC)
+                grid_frame.pack(fill=tk.X, pady=(0, 10))
+
+                tk.Label(grid_frame, text='PUBLIC KEY INFORMATION',
+                         font=FONT_LABEL,
+                         bg=BG_ELEVATED, fg=ACCENT).grid(
+                    row=0, column=0, columnspan=2, sticky='w', pady=(0, 8))
+
+                details_tree(grid_frame,
+                             [(_detail_label(k), str(v))
+                              for k, v in pubkey_details.items() if k != 'pem']
+                             ).grid(row=1, column=0, columnspan=2, sticky='ew')
+
+                self._pem_block(pubkey_frame, pubkey_pem, 'PUBLIC KEY PEM', 'Public Key')
+            else:
+                tk.Label(pubkey_frame, text='No public key available',
+                         font=FONT_UI, bg=BG_CARD, fg=TEXT_SEC).pack(pady=30)
 
         # ── Private Key Tab ───────────────────────────────────────────────────
-        if self.key_manager.private_key:
-            warn_frame = tk.Frame(privkey_frame, bg='#1A0A0E',
-                                  padx=14, pady=10,
-                                  highlightthickness=1,
-                                  highlightbackground='#4A1520')
-            warn_frame.pack(fill=tk.X, pady=(0, 12))
-            tk.Label(warn_frame, text='⚠  NEVER SHARE YOUR PRIVATE KEY',
-                     font=('Segoe UI', 10, 'bold'),
-                     bg='#1A0A0E', fg=RED).pack(anchor='w')
-            tk.Label(warn_frame,
-                     text='Shown here for educational purposes only.',
-                     font=FONT_SMALL, bg='#1A0A0E', fg=ORANGE).pack(anchor='w')
-
-            pass_row = tk.Frame(privkey_frame, bg=BG_CARD)
-            pass_row.pack(fill=tk.X, pady=(0, 10))
-            tk.Label(pass_row, text='Encrypt with password (optional):',
-                     font=FONT_SMALL, bg=BG_CARD, fg=TEXT_SEC).pack(side=tk.LEFT, padx=(0, 8))
-            privkey_password = dark_entry(pass_row, show='*', width=18)
-            privkey_password.pack(side=tk.LEFT, padx=(0, 8), ipady=5)
-
-            pem_frame = tk.Frame(privkey_frame, bg=BG_CARD)
-            pem_frame.pack(fill=tk.BOTH, expand=True)
-
-            tk.Label(pem_frame,
-                     text="Enter password and click 'Show Private Key'",
-                     font=('Segoe UI', 9, 'italic'),
-                     bg=BG_CARD, fg=TEXT_MUTED).pack(pady=20)
-
-            def show_private_key():
-                password = privkey_password.get() or None
-                try:
-                    privkey_pem = self.key_manager.export_private_key_pem(password)
+        def build_privkey_tab():
+            nonlocal reset_private_view
+            if self.key_manager.private_key:
+                warn_frame = tk.Frame(privkey_frame, bg='#1A0A0E',
+                                      padx=14, pady=10,
+                                      highlightthickness=1,
+                                      highlightbackground='#4A1520')
+                warn_frame.pack(fill=tk.X, pady=(0, 12))
+                tk.Label(warn_frame, text='⚠  NEVER SHARE YOUR PRIVATE KEY',
+                         font=FONT_BOLD_10,
+                         bg='#1A0A0E', fg=RED).pack(anchor='w')
+                tk.Label(warn_frame,
+                         text='Shown here for educational purposes only.',
+                         font=FONT_SMALL, bg='#1A0A0E', fg=ORANGE).pack(anchor='w')
+
+                pass_row = tk.Frame(privkey_frame, bg=BG_CARD)
+                pass_row.pack(fill=tk.X, pady=(0, 10))
+                tk.Label(pass_row, text='Encrypt with password (optional):',
+                         font=FONT_SMALL, bg=BG_CARD, fg=TEXT_SEC).pack(side=tk.LEFT, padx=(0, 8))
+                privkey_password = dark_entry(pass_row, show='*', width=18)
+                privkey_password.pack(side=tk.LEFT, padx=(0, 8), ipady=5)
+
+                pem_frame = tk.Frame(privkey_frame, bg=BG_CARD)
+                pem_frame.pack(fill=tk.BOTH, expand=True)
+
+                def reset_private_view():
                     for w in pem_frame.winfo_children():
                         w.destroy()
-                    pt = dark_text(pem_frame, height=12, font=FONT_MONO)
-                    pt.pack(fill=tk.BOTH, expand=True)
-                    pt.insert('1.0', privkey_pem)
-                    ttk.Button(pem_frame, text='Copy to Clipboard',
-                               command=lambda: self.copy_to_clipboard(privkey_pem, 'Private Key'),
-                               style='TButton', width=18).pack(pady=6)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to export private key: {e}")
-
-            ttk.Button(pass_row, text='Show Private Key',
-                       command=show_private_key,
-                       style='Danger.TButton', width=15).pack(side=tk.LEFT)
-        else:
-            tk.Label(privkey_frame, text='No private key available',
-                     font=FONT_UI, bg=BG_CARD, fg=TEXT_SEC).pack(pady=30)
-
-        # ── Revocation Tab ────────────────────────────────────────────────────
-        revoked_list = self.key_manager.get_revoked_certificates()
-
-        cur_frame = tk.Frame(revoke_frame, bg=BG_ELEVATED,
-                             padx=14, pady=12,
-                             highlightthickness=1,
-                             highlightbackground=BORDER_ACC)
-        cur_frame.pack(fill=tk.X, pady=(0, 10))
-        tk.Label(cur_frame, text='CURRENT CERTIFICATE STATUS',
-                 font=('Segoe UI', 8, 'bold'),
-                 bg=BG_ELEVATED, fg=ACCENT).pack(anchor='w', pady=(0, 6))
-
-        if self.key_manager.certificate:
-            serial     = self.key_manager.get_certificate_serial()
-            is_revoked = self.key_manager.is_revoked(serial)
-            tk.Label(cur_frame, text=f'Serial: {serial}',
-                     font=FONT_MONO, bg=BG_ELEVATED, fg=TEXT_SEC).pack(anchor='w', pady=2)
-            if is_revoked:
-                tk.Label(cur_frame, text='Status:  ❌  REVOKED',
-                         font=('Segoe UI', 10, 'bold'),
-                         bg=BG_ELEVATED, fg=RED).pack(anchor='w', pady=4)
+                    privkey_password.delete(0, tk.END)
+                    tk.Label(pem_frame,
+                             text="Enter password and click 'Show Private Key'",
+                             font=FONT_ITALIC_9,
+                             bg=BG_CARD, fg=TEXT_MUTED).pack(pady=20)
+
+                reset_private_view()
+
+                def show_private_key():
+                    password = privkey_password.get() or None
+                    try:
+                        privkey_pem = self.key_manager.export_private_key_pem(password)
+                        for w in pem_frame.winfo_children():
+                            w.destroy()
+                        pt = dark_text(pem_frame, height=12, font=FONT_MONO,
+                                       undo=False, autoseparators=False)
+                        pt.pack(fill=tk.BOTH, expand=True)
+                        pt.insert('1.0', privkey_pem)
+                        pt.config(state='disabled')
+                        ttk.Button(pem_frame, text='Copy to Clipboard',
+                                   command=lambda: self.copy_to_clipboard(privkey_pem, 'Private Key', pem_frame),
+                                   style='TButton', width=18).pack(pady=6)
+                    except Exception as e:
+                        messagebox.showerror("Error", f"Failed to export private key: {e}")
+
+                ttk.Button(pass_row, text='Show Private Key',
+                           command=show_private_key,
+                           style='Danger.TButton', width=15).pack(side=tk.LEFT)
             else:
-                tk.Label(cur_frame, text='Status:  ✅  ACTIVE',
-                         font=('Segoe UI', 10, 'bold'),
-                         bg=BG_ELEVATED, fg=GREEN).pack(anchor='w', pady=4)
-
-        rev_list_frame = tk.Frame(revoke_frame, bg=BG_CARD,
-                                   highlightthickness=1,
-                                   highlightbackground=BORDER_ACC)
-        rev_list_frame.pack(fill=tk.BOTH, expand=True)
+                tk.Label(privkey_frame, text='No private key available',
+                         font=FONT_UI, bg=BG_CARD, fg=TEXT_SEC).pack(pady=30)
 
-        tk.Label(rev_list_frame, text='GLOBALLY REVOKED CERTIFICATES',
-                 font=('Segoe UI', 8, 'bold'),
-                 bg=BG_CARD, fg=ACCENT,
-                 padx=10, pady=8).pack(anchor='w')
-
-        if revoked_list:
-            cols = ('serial', 'revoked_by', 'timestamp')
-            tree = ttk.Treeview(rev_list_frame, columns=cols,
-                                show='headings', height=7)
-            tree.heading('serial',     text='Certificate Serial')
-            tree.heading('revoked_by', text='Revoked By')
-            tree.heading('timestamp',  text='Revocation Time')
-            tree.column('serial',     width=200)
-            tree.column('revoked_by', width=100)
-            tree.column('timestamp',  width=200)
-            for cert in revoked_list:
-                tree.insert('', 'end',
-                            values=(cert['serial'][-16:],
-                                    cert['revoked_by'],
-                                    cert['timestamp'][:19]))
-            rsb = ttk.Scrollbar(rev_list_frame, orient=tk.VERTICAL,
-                                command=tree.yview)
-            rsb.pack(side=tk.RIGHT, fill=tk.Y)
-            tree.configure(yscrollcommand=rsb.set)
-            tree.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
-        else:
-            tk.Label(rev_list_frame,
-                     text='No revoked certificates in the global list.',
-                     font=('Segoe UI', 9, 'italic'),
-                     bg=BG_CARD, fg=TEXT_MUTED).pack(pady=20)
+        # ── Revocation Tab ────────────────────────────────────────────────────
+        def build_revoke_tab():
+            # Read fresh on every open; other processes may have revoked since
+            revoked_list = self.key_manager.get_revoked_certificates()
+
+            cur_frame = tk.Frame(revoke_frame, bg=BG_ELEVATED,
+                                 padx=14, pady=12,
+                                 highlightthickness=1,
+                                 highlightbackground=BORDER_ACC)
+            cur_frame.pack(fill=tk.X, pady=(0, 10))
+            tk.Label(cur_frame, text='CURRENT CERTIFICATE STATUS',
+                     font=FONT_LABEL,
+                     bg=BG_ELEVATED, fg=ACCENT).pack(anchor='w', pady=(0, 6))
 
-        # Close
+            if self.key_manager.certificate:
+                serial     = self.key_manager.get_certificate_serial()
+                record = None
+                if self.key_manager.is_revoked(serial):
+                    record = next((cert for cert in revoked_list
+                                   if cert['serial'] == serial), None)
+                tk.Label(cur_frame, text=f'Serial: {serial}',
+                         font=FONT_MONO, bg=BG_ELEVATED, fg=TEXT_SEC).pack(anchor='w', pady=2)
+                if record:
+                    tk.Label(cur_frame, text='Status:  ❌  REVOKED',
+                             font=FONT_BOLD_10,
+                             bg=BG_ELEVATED, fg=RED).pack(anchor='w', pady=4)
+                    tk.Label(cur_frame,
+                             text=f"Revoked by {record['revoked_by']} at {record['timestamp'][:19]}",
+                             font=FONT_SMALL, bg=BG_ELEVATED, fg=TEXT_SEC).pack(anchor='w')
+                else:
+                    tk.Label(cur_frame, text='Status:  ✅  ACTIVE',
+                             font=FONT_BOLD_10,
+                             bg=BG_ELEVATED, fg=GREEN).pack(anchor='w', pady=4)
+
+            rev_list_frame = tk.Frame(revoke_frame, bg=BG_CARD,
+                                       highlightthickness=1,
+                                       highlightbackground=BORDER_ACC)
+            rev_list_frame.pack(fill=tk.BOTH, expand=True)
+
+            tk.Label(rev_list_frame, text='GLOBALLY REVOKED CERTIFICATES',
+                     font=FONT_LABEL,
+                     bg=BG_CARD, fg=ACCENT,
+                     padx=10, pady=8).pack(anchor='w')
+
+            if revoked_list:
+                cols = ('serial', 'revoked_by', 'timestamp')
+                tree = ttk.Treeview(rev_list_frame, columns=cols,
+                                    show='headings', height=7)
+                tree.heading('serial',     text='Certificate Serial')
+                tree.heading('revoked_by', text='Revoked By')
+                tree.heading('timestamp',  text='Revocation Time')
+                tree.column('serial',     width=200)
+                tree.column('revoked_by', width=100)
+                tree.column('timestamp',  width=200)
+                rsb = ttk.Scrollbar(rev_list_frame, orient=tk.VERTICAL)
+                rsb.pack(side=tk.RIGHT, fill=tk.Y)
+                tree.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
+                # Only the visible rows are inserted; the list can be very long
+                VirtualRows(tree, rsb, revoked_list,
+                            lambda cert: (cert['serial'][-16:],
+                                          cert['revoked_by'],
+                                          cert['timestamp'][:19]))
+            else:
+                tk.Label(rev_list_frame,
+                         text='No revoked certificates in the global list.',
+                         font=FONT_ITALIC_9,
+                         bg=BG_CARD, fg=TEXT_MUTED).pack(pady=20)
+
+        # Build tabs on first view; only the initially selected one is built now
+        tab_builders = {
+            str(cert_frame):    build_cert_tab,
+            str(pubkey_frame):  build_pubkey_tab,
+            str(privkey_frame): build_privkey_tab,
+            str(revoke_frame):  build_revoke_tab,
+        }
+
+        def on_tab_changed(event=None):
+            builder = tab_builders.pop(notebook.select(), None)
+            if builder:
+                builder()
+
+        on_tab_changed()
+        notebook.bind('<<NotebookTabChanged>>', on_tab_changed)
+
+        def reopen():
+            # The revocation list can change while the viewer is hidden
+            for child in revoke_frame.winfo_children():
+                child.destroy()
+            tab_builders[str(revoke_frame)] = build_revoke_tab
+            on_tab_changed()
+        self._cert_viewer_reopen = reopen
+
+        # Close — hide rather than destroy so the next open is instant
+        def hide():
+            # Never keep an exported private key on screen in the hidden window
+            if reset_private_view:
+                reset_private_view()
+            win.grab_release()
+            win.withdraw()
+
+        win.protocol('WM_DELETE_WINDOW', hide)
         tk.Frame(win, bg=BORDER_ACC, height=1).pack(fill=tk.X, pady=(6, 0))
         close_bar = tk.Frame(win, bg=BG_ROOT, pady=10)
         close_bar.pack(fill=tk.X)
-        ttk.Button(close_bar, text='Close', command=win.destroy,
+        ttk.Button(close_bar, text='Close', command=hide,
                    style='TButton', width=10).pack(side=tk.RIGHT, padx=20)
+        self._cert_viewer = win
+
+    def _make_modal(self, title, size, heading, parent=None, *, subtitle=None,
+                    banner=False, accent=ACCENT, heading_fg=TEXT_PRI,
+                    padding=(30, 24), resizable=False):
+        """
+        Build the chrome every dialog shares: a modal Toplevel over parent
+        with the accent bar and a heading. banner=True puts the heading in
+        a full-width header bar (large windows); otherwise it tops the body.
+
+        Returns:
+            (Toplevel, body frame)
+        """
+        parent = parent or self.root
+        win = tk.Toplevel(parent)
+        win.title(title)
+        win.geometry(size)
+        win.configure(bg=BG_ROOT)
+        win.transient(parent)
+        win.grab_set()
+        win.resizable(resizable, resizable)
+
+        tk.Frame(win, bg=accent, height=3).pack(fill=tk.X)
+
+        if banner:
+            header = tk.Frame(win, bg='#060A10', padx=20, pady=14)
+            header.pack(fill=tk.X)
+            tk.Label(header, text=heading,
+                     font=FONT_HEADING_14,
+                     bg='#060A10', fg=heading_fg).pack(side=tk.LEFT)
+            if subtitle:
+                tk.Label(header, text=subtitle,
+                         font=FONT_MONO_10,
+                         bg='#060A10', fg=TEXT_SEC).pack(side=tk.LEFT)
+            tk.Frame(win, bg=BORDER_ACC, height=1).pack(fill=tk.X)
+
+        padx, pady = padding
+        body = tk.Frame(win, bg=BG_ROOT, padx=padx, pady=pady)
+        body.pack(fill=tk.BOTH, expand=True)
+        if not banner:
+            tk.Label(body, text=heading,
+                     font=FONT_HEADING,
+                     bg=BG_ROOT, fg=heading_fg).pack(pady=(0, 18))
+        return win, body
+
+    def _drop_cert_viewer(self):
+        """Destroy the cached certificate viewer so it is rebuilt on next open."""
+        if self._cert_viewer is not None and self._cert_viewer.winfo_exists():
+            self._cert_viewer.destroy()
+        self._cert_viewer = None
+        self._cert_viewer_reopen = None
 
     def _pem_block(self, parent, pem_text, label, copy_label):
         """Helper: render a PEM block with copy button."""
-        tk.Label(parent, text=label, font=('Segoe UI', 8, 'bold'),
+        tk.Label(parent, text=label, font=FONT_LABEL,
                  bg=BG_CARD, fg=ACCENT).pack(anchor='w', pady=(6, 4))
-        pt = dark_text(parent, height=9, font=FONT_MONO)
+        # Read-only block: never record undo history for the PEM insert
+        pt = dark_text(parent, height=9, font=FONT_MONO,
+                       undo=False, autoseparators=False)
         pt.pack(fill=tk.BOTH, expand=True)
         pt.insert('1.0', pem_text)
         pt.config(state='disabled')
         ttk.Button(parent, text='Copy to Clipboard',
-                   command=lambda: self.copy_to_clipboard(pem_text, copy_label),
+                   command=lambda: self.copy_to_clipboard(pem_text, copy_label, parent),
                    style='TButton', width=18).pack(pady=6, anchor='w')
 
-    def copy_to_clipboard(self, text, item_type):
+    def copy_to_clipboard(self, text, item_type, source=None):
         self.root.clipboard_clear()
         self.root.clipboard_append(text)
-        messagebox.showinfo("Copied", f"{item_type} copied to clipboard!")
+        self._toast(source or self.root, f"{item_type} copied to clipboard")
+
+    def _toast(self, widget, message, ms=1200):
+        """Brief non-modal notice at the bottom of widget's window."""
+        label = tk.Label(widget.winfo_toplevel(), text=f'  ✓  {message}  ',
+                         font=FONT_BOLD_9, bg=BG_ELEVATED, fg=GREEN,
+                         padx=8, pady=6,
+                         highlightthickness=1, highlightbackground=BORDER_ACC)
+        label.place(relx=0.5, rely=1.0, y=-16, anchor='s')
+        label.lift()
+        self.root.after(ms, label.destroy)
 
     # ─────────────────────────────────────────────────────────────────────────
     # PROFILE (ENLARGED)
     # ─────────────────────────────────────────────────────────────────────────
     def show_profile(self):
-        user_info = self.user_manager.get_user_info(self.current_user['username'])
+        user_info = self._get_user_info(self.current_user['username'])
 
-        win = tk.Toplevel(self.root)
-        win.title("User Profile")
-        # Increased window size for better visibility of revocation option
-        win.geometry("550x720")
-        win.configure(bg=BG_ROOT)
-        win.transient(self.root)
-        win.grab_set()
-        win.resizable(True, True)  # allow resizing
-
-        tk.Frame(win, bg=ACCENT, height=3).pack(fill=tk.X)
-
-        header = tk.Frame(win, bg='#060A10', padx=20, pady=14)
-        header.pack(fill=tk.X)
-        tk.Label(header, text='👤  User Profile',
-                 font=('Segoe UI', 14, 'bold'),
-                 bg='#060A10', fg=TEXT_PRI).pack(side=tk.LEFT)
-        tk.Frame(win, bg=BORDER_ACC, height=1).pack(fill=tk.X)
-
-        scroll_outer = tk.Frame(win, bg=BG_ROOT)
-        scroll_outer.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+        # Tall window so the revocation option is visible; resizable
+        win, scroll_outer = self._make_modal(
+            "User Profile", "550x720", '👤  User Profile',
+            banner=True, padding=(20, 15), resizable=True)
 
         def section(title):
             tk.Label(scroll_outer, text=title.upper(),
-                     font=('Segoe UI', 8, 'bold'),
+                     font=FONT_LABEL,
                      bg=BG_ROOT, fg=ACCENT).pack(anchor='w', pady=(10, 4))
             f = tk.Frame(scroll_outer, bg=BG_ELEVATED,
                          padx=14, pady=12,
@@ -988,40 +1398,24 @@ class CryptDiaryApp:
             f.pack(fill=tk.X)
             return f
 
-        def row(parent, label, value):
-            r = tk.Frame(parent, bg=BG_ELEVATED)
-            r.pack(fill=tk.X, pady=3)
-            tk.Label(r, text=label, font=('Segoe UI', 9),
-                     bg=BG_ELEVATED, fg=TEXT_SEC, width=16, anchor='w').pack(side=tk.LEFT)
-            tk.Label(r, text=value, font=('Segoe UI', 9, 'bold'),
-                     bg=BG_ELEVATED, fg=TEXT_PRI).pack(side=tk.LEFT, padx=8)
-
         # Personal info
         pi = section('Personal Information')
-        row(pi, 'Username',    user_info['username'])
-        row(pi, 'Full Name',   user_info.get('full_name', 'Not set'))
-        row(pi, 'Member Since', user_info['created'][:10])
+        details_tree(pi, [
+            ('Username',     user_info['username']),
+            ('Full Name',    user_info.get('full_name', 'Not set')),
+            ('Member Since', user_info['created'][:10]),
+        ]).pack(fill=tk.X)
 
         # Certificate info
         ci = section('Certificate')
         if self.key_manager and self.key_manager.certificate:
             cert_serial = str(self.key_manager.certificate.serial_number)
             is_rev = self.key_manager.is_revoked(cert_serial)
-            row(ci, 'Serial (last 12)', cert_serial[-12:])
-            row(ci, 'Valid Until',
-                str(self.key_manager.certificate.not_valid_after.date()))
-            status_row_f = tk.Frame(ci, bg=BG_ELEVATED)
-            status_row_f.pack(fill=tk.X, pady=3)
-            tk.Label(status_row_f, text='Status', font=('Segoe UI', 9),
-                     bg=BG_ELEVATED, fg=TEXT_SEC, width=16, anchor='w').pack(side=tk.LEFT)
-            if is_rev:
-                tk.Label(status_row_f, text='❌  REVOKED',
-                         font=('Segoe UI', 9, 'bold'),
-                         bg=BG_ELEVATED, fg=RED).pack(side=tk.LEFT, padx=8)
-            else:
-                tk.Label(status_row_f, text='✅  ACTIVE',
-                         font=('Segoe UI', 9, 'bold'),
-                         bg=BG_ELEVATED, fg=GREEN).pack(side=tk.LEFT, padx=8)
+            details_tree(ci, [
+                ('Serial (last 12)', cert_serial[-12:]),
+                ('Valid Until', str(self.key_manager.certificate.not_valid_after.date())),
+                ('Status', '❌  REVOKED', 'bad') if is_rev else ('Status', '✅  ACTIVE', 'good'),
+            ]).pack(fill=tk.X)
             ttk.Button(ci, text='View Full Certificate',
                        command=self.show_certificates_viewer,
                        style='TButton', width=20).pack(anchor='w', pady=(8, 0))
@@ -1079,22 +1473,9 @@ class CryptDiaryApp:
             messagebox.showinfo("Already Revoked", "This certificate is already revoked.")
             return
 
-        confirm_window = tk.Toplevel(parent_window)
-        confirm_window.title("Confirm Revocation")
-        confirm_window.geometry("420x300")
-        confirm_window.configure(bg=BG_ROOT)
-        confirm_window.transient(parent_window)
-        confirm_window.grab_set()
-        confirm_window.resizable(False, False)
-
-        tk.Frame(confirm_window, bg=RED, height=3).pack(fill=tk.X)
-
-        frame = tk.Frame(confirm_window, bg=BG_ROOT, padx=28, pady=24)
-        frame.pack(fill=tk.BOTH, expand=True)
-
-        tk.Label(frame, text='⚠  CERTIFICATE REVOCATION',
-                 font=('Segoe UI', 13, 'bold'),
-                 bg=BG_ROOT, fg=RED).pack(pady=(0, 12))
+        confirm_window, frame = self._make_modal(
+            "Confirm Revocation", "420x300", '⚠  CERTIFICATE REVOCATION',
+            parent_window, accent=RED, heading_fg=RED, padding=(28, 24))
 
         warn_box = tk.Frame(frame, bg='#1A0A0E', padx=14, pady=12,
                             highlightthickness=1, highlightbackground='#4A1520')
@@ -1104,7 +1485,7 @@ class CryptDiaryApp:
                      '• Invalidates ALL your past signatures',
                      '• Makes new signatures untrusted',
                      '• May affect shared entries']:
-            tk.Label(warn_box, text=line, font=('Segoe UI', 9),
+            tk.Label(warn_box, text=line, font=FONT_UI_9,
                      bg='#1A0A0E', fg=ORANGE, anchor='w').pack(anchor='w', pady=2)
 
         btn_row = tk.Frame(frame, bg=BG_ROOT)
@@ -1113,6 +1494,7 @@ class CryptDiaryApp:
         def do_revoke():
             username = self.current_user['username']
             self.key_manager.revoke_certificate(serial, username)
+            self._drop_cert_viewer()
             messagebox.showinfo("Certificate Revoked",
                                 "Your certificate has been revoked.\n\n"
                                 "All future verifications will reflect this.",
@@ -1130,22 +1512,8 @@ class CryptDiaryApp:
                    style='TButton', width=10).pack(side=tk.LEFT)
 
     def change_password(self, parent):
-        dialog = tk.Toplevel(parent)
-        dialog.title("Change Password")
-        dialog.geometry("420x320")
-        dialog.configure(bg=BG_ROOT)
-        dialog.transient(parent)
-        dialog.grab_set()
-        dialog.resizable(False, False)
-
-        tk.Frame(dialog, bg=ACCENT, height=3).pack(fill=tk.X)
-
-        frame = tk.Frame(dialog, bg=BG_ROOT, padx=30, pady=24)
-        frame.pack(fill=tk.BOTH, expand=True)
-
-        tk.Label(frame, text='🔑  Change Password',
-                 font=('Segoe UI', 13, 'bold'),
-                 bg=BG_ROOT, fg=TEXT_PRI).pack(pady=(0, 18))
+        dialog, frame = self._make_modal(
+            "Change Password", "420x320", '🔑  Change Password', parent)
 
         def fld(lbl, **kw):
             tk.Label(frame, text=lbl, font=FONT_SMALL,
@@ -1174,6 +1542,7 @@ class CryptDiaryApp:
             result = self.user_manager.change_password(
                 self.current_user['username'], old_p, new_p)
             if result is True:
+                self._user_info_cache.pop(self.current_user['username'], None)
                 messagebox.showinfo("Success", "Password changed successfully!", parent=dialog)
                 dialog.destroy()
             else:
@@ -1183,24 +1552,10 @@ class CryptDiaryApp:
                    style='Action.TButton', width=16).pack(pady=(18, 0))
 
     def update_profile(self, parent):
-        dialog = tk.Toplevel(parent)
-        dialog.title("Update Full Name")
-        dialog.geometry("400x220")
-        dialog.configure(bg=BG_ROOT)
-        dialog.transient(parent)
-        dialog.grab_set()
-        dialog.resizable(False, False)
-
-        tk.Frame(dialog, bg=ACCENT, height=3).pack(fill=tk.X)
-
-        frame = tk.Frame(dialog, bg=BG_ROOT, padx=30, pady=24)
-        frame.pack(fill=tk.BOTH, expand=True)
-
-        tk.Label(frame, text='✏  Update Full Name',
-                 font=('Segoe UI', 13, 'bold'),
-                 bg=BG_ROOT, fg=TEXT_PRI).pack(pady=(0, 18))
+        dialog, frame = self._make_modal(
+            "Update Full Name", "400x220", '✏  Update Full Name', parent)
 
-        user_info = self.user_manager.get_user_info(self.current_user['username'])
+        user_info = self._get_user_info(self.current_user['username'])
 
         tk.Label(frame, text='Full Name', font=FONT_SMALL,
                  bg=BG_ROOT, fg=TEXT_SEC).pack(anchor='w', pady=(0, 4))
@@ -1212,6 +1567,7 @@ class CryptDiaryApp:
             fullname = name_entry.get().strip()
             if self.user_manager.update_user_info(
                     self.current_user['username'], full_name=fullname):
+                self._user_info_cache.pop(self.current_user['username'], None)
                 messagebox.showinfo("Success", "Full name updated!", parent=dialog)
                 dialog.destroy()
                 parent.destroy()
@@ -1225,28 +1581,45 @@ class CryptDiaryApp:
     # ─────────────────────────────────────────────────────────────────────────
     # DIARY ENTRY OPERATIONS
     # ─────────────────────────────────────────────────────────────────────────
-    def refresh_entry_list(self):
-        self.entry_listbox.delete(0, tk.END)
-        search_query = self.search_var.get() if hasattr(self, 'search_var') else ''
-        entries = (self.diary_storage.search_entries(search_query)
-                   if search_query else self.diary_storage.list_entries())
-
-        for i, entry in enumerate(entries):
-            created = datetime.fromisoformat(entry['created']).strftime('%Y-%m-%d  %H:%M')
-            self.entry_listbox.insert(tk.END, f'  {entry["title"]}')
-            # Alternate row shade
-            if i % 2 == 0:
-                self.entry_listbox.itemconfig(i, bg='#0C1220', fg=TEXT_PRI)
-            else:
-                self.entry_listbox.itemconfig(i, bg='#0A0F1A', fg=TEXT_PRI)
+    def _on_search_changed(self, *args):
+        """Debounce search keystrokes: refresh once typing pauses for 150 ms."""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._do_refresh)
+
+    def _do_refresh(self):
+        self._search_after_id = None
+        if self.diary_storage:
+            self.refresh_entry_list(self.search_var.get().strip().lower())
+
+    def _cancel_search_refresh(self):
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
+
+    def refresh_entry_list(self, query=None):
+        """
+        Rebuild the entry list for the current search query. Skipped when
+        neither the query nor the entries changed since the last build.
+        """
+        if query is None:
+            query = self.search_var.get().strip().lower() if hasattr(self, 'search_var') else ''
+        if query == self._last_query and not self._entries_dirty:
+            return
+        self._last_query = query
+        self._entries_dirty = False
+
+        entries = (self.diary_storage.search_entries(query)
+                   if query else self.diary_storage.list_entries())
 
         self.entry_data = entries
+        self._entry_rows.set_rows(entries)
 
     def on_entry_select(self, event):
-        selection = self.entry_listbox.curselection()
+        selection = self.entry_tree.selection()
         if not selection:
             return
-        index = selection[0]
+        index = self._entry_rows.index_of(selection[0])
         entry_metadata = self.entry_data[index]
         if not self.verify_password():
             return
@@ -1266,13 +1639,32 @@ class CryptDiaryApp:
         messagebox.showerror("Error", "Incorrect password.")
         return False
 
+    def _get_io_pool(self):
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cryptdiary-io')
+        return self._io_pool
+
     def load_entry(self, entry_id):
+        """Verify and decrypt an entry on a worker thread, then fill the editor."""
         metadata, encrypted_data = self.diary_storage.load_entry(entry_id)
         if not metadata:
             messagebox.showerror("Error", "Failed to load entry")
             return
+        self._load_seq += 1
+        seq = self._load_seq
+        self.signature_label.config(text='  …  Verifying signature', fg=TEXT_MUTED)
+        self.revocation_label.config(text='')
+        future = self._get_io_pool().submit(
+            self.crypto_manager.verify_and_decrypt, encrypted_data)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_loaded_entry, seq, entry_id, metadata, f))
+
+    def _apply_loaded_entry(self, seq, entry_id, metadata, future):
+        # A newer load, or a logout, superseded this one
+        if seq != self._load_seq:
+            return
         try:
-            plaintext, is_valid, is_revoked = self.crypto_manager.verify_and_decrypt(encrypted_data)
+            plaintext, is_valid, is_revoked = future.result()
 
             self.current_entry_id = entry_id
             self.title_entry.delete(0, tk.END)
@@ -1295,6 +1687,7 @@ class CryptDiaryApp:
                     text='  ✓  Certificate active', fg=GREEN)
 
         except Exception as e:
+            self.signature_label.config(text='')
             messagebox.showerror("Error", f"Failed to decrypt entry: {e}")
 
     def new_entry(self):
@@ -1303,12 +1696,13 @@ class CryptDiaryApp:
 
     def save_entry(self):
         title   = self.title_entry.get().strip()
-        content = self.content_text.get('1.0', tk.END).strip()
+        # 'end-1c' skips the newline Tk always keeps at the end of a Text
+        content = self.content_text.get('1.0', 'end-1c')
 
         if not title:
             messagebox.showerror("Error", "Please enter a title")
             return
-        if not content:
+        if not content.strip():
             messagebox.showerror("Error", "Please enter content")
             return
 
@@ -1334,6 +1728,7 @@ class CryptDiaryApp:
                 self.current_entry_id = entry_id
                 messagebox.showinfo("Saved", "Entry saved successfully")
 
+            self._entries_dirty = True
             self.refresh_entry_list()
             self.signature_label.config(
                 text='  ✓  Encrypted and signed', fg=GREEN)
@@ -1352,6 +1747,7 @@ class CryptDiaryApp:
             try:
                 self.diary_storage.delete_entry(self.current_entry_id)
                 self.clear_editor()
+                self._entries_dirty = True
                 self.refresh_entry_list()
                 messagebox.showinfo("Deleted", "Entry deleted successfully")
             except Exception as e:
@@ -1374,8 +1770,8 @@ class CryptDiaryApp:
                 defaultextension=".cdpkg",
                 filetypes=[("CryptDiary Package", "*.cdpkg"), ("All files", "*.*")])
             if filename:
-                with open(filename, 'w') as f:
-                    json.dump(package, f, indent=2)
+                with open(filename, 'wb') as f:
+                    f.write(dumps(package))
                 messagebox.showinfo("Exported", "Entry exported successfully.")
         except Exception as e:
             messagebox.showerror("Export Failed", str(e))
@@ -1386,8 +1782,8 @@ class CryptDiaryApp:
         if not filename:
             return
         try:
-            with open(filename, 'r') as f:
-                package = json.load(f)
+            with open(filename, 'rb') as f:
+                package = loads(f.read())
 
             metadata, encrypted_data, sig_valid, is_revoked, cert = \
                 self.crypto_manager.import_entry(package)
@@ -1415,6 +1811,7 @@ class CryptDiaryApp:
                     new_encrypted = self.crypto_manager.encrypt_and_sign(plaintext)
                     title = f"[Imported] {metadata['title']}"
                     self.diary_storage.save_entry(title, new_encrypted)
+                    self._entries_dirty = True
                     self.refresh_entry_list()
                     messagebox.showinfo("Success",
                                         "Entry saved and re-encrypted for you.")
@@ -1428,6 +1825,7 @@ class CryptDiaryApp:
             messagebox.showerror("Import Failed", str(e))
 
     def clear_editor(self):
+        self._load_seq += 1     # drop any entry still being decrypted
         self.current_entry_id = None
         self.title_entry.delete(0, tk.END)
         self.content_text.delete('1.0', tk.END)
@@ -1444,6 +1842,16 @@ class CryptDiaryApp:
 
     def logout(self):
         if messagebox.askyesno("Confirm Logout", "Are you sure you want to logout?"):
+            self._cancel_search_refresh()
+            self._drop_cert_viewer()
+            # The main screen is kept for the next login; don't leave this
+            # user's titles or open entry in it
+            self.clear_editor()
+            self.entry_data = []
+            self._entry_rows.set_rows(self.entry_data)
+            self._last_query = None
+            if self.diary_storage:
+                self.diary_storage.close()
             self.is_authenticated  = False
             self.current_user      = None
             self.key_manager       = None
@@ -1456,6 +1864,8 @@ def main():
     root = tk.Tk()
     app  = CryptDiaryApp(root)
     root.mainloop()
+    if app.diary_storage:
+        app.diary_storage.close()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,15 @@
 import os
+import base64
 import time
+import timeit
 import tempfile
 import shutil
-import statistics
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 
 # Import CryptDiary modules
-from user_manager import UserManager
-from key_manager import KeyManager
+from user_manager import UserManager, _password_hash_cache
+from key_manager import KeyManager, _keystore_cache
 from crypto_manager import CryptoManager
 from diary_storage import DiaryStorage
 
@@ -18,34 +20,76 @@ from diary_storage import DiaryStorage
 @contextmanager
 def timer(label, results_dict):
     """Simple context manager to time a block of code once."""
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     yield
-    elapsed = time.perf_counter() - start
-    results_dict[label] = elapsed
-    print(f"{label:40s} : {elapsed*1000:8.3f} ms")
+    elapsed_ns = time.perf_counter_ns() - start
+    results_dict[label] = elapsed_ns / 1e9
+    print(f"{label:40s} : {elapsed_ns / 1e6:8.3f} ms")
 
 
-def timed_func(func, *args, repeats=5, **kwargs):
+def timed_func(func, *args, repeats=5, number=None, **kwargs):
     """
-    Run a function multiple times and return (average_time, last_result).
-    The function is called with *args and **kwargs for each repetition.
+    Time func(*args, **kwargs) with timeit and return (time_per_call, result).
+    The loop count is calibrated with autorange() so fast calls are timed over
+    many iterations; the best of `repeats` rounds is reported, as timeit does.
+    Calls that write state must pass a small fixed `number` instead, or
+    autorange would keep them running until the state itself dominates.
     """
-    times = []
-    result = None
-    for _ in range(repeats):
-        start = time.perf_counter()
-        result = func(*args, **kwargs)
-        times.append(time.perf_counter() - start)
-    avg_time = statistics.mean(times)
-    return avg_time, result
+    t = timeit.Timer(lambda: func(*args, **kwargs))
+    if number is None:
+        number, _ = t.autorange()
+    times = t.repeat(repeat=repeats, number=number)
+    result = func(*args, **kwargs)
+    return min(times) / number, result
+
+
+# Writes per round for the save_entry benchmarks (5 rounds of these)
+SAVE_ENTRY_CALLS = 10
 
 
 # ----------------------------------------------------------------------
 # Test data generation
 # ----------------------------------------------------------------------
 def generate_test_data(size_kb):
-    """Generate a string of given size in KB."""
-    return "x" * (size_kb * 1024)
+    """
+    Generate a payload of given size in KB: random (incompressible) text, as a
+    read-only memoryview so every timed call shares one buffer without copies.
+    Base64 keeps it valid UTF-8, since decrypt_entry returns str.
+    """
+    return memoryview(base64.b64encode(os.urandom(size_kb * 768))).toreadonly()
+
+
+def encrypt_decrypt_benchmark(user_dir, password, size_kb, plain):
+    """
+    Worker for the payload-size sweep, run in its own process: load the
+    test user's keys and return [(label, seconds), ...] for encrypt and decrypt.
+    """
+    key_manager = KeyManager(user_dir=user_dir)
+    if not key_manager.load_keystore(password):
+        raise RuntimeError("Failed to load keys")
+    crypto_manager = CryptoManager(key_manager)
+
+    # Untimed warm-up: touches the payload's pages and the cipher path
+    crypto_manager.encrypt_entry(plain)
+
+    enc_time, encrypted = timed_func(crypto_manager.encrypt_entry, plain)
+    dec_time, _ = timed_func(crypto_manager.decrypt_entry, encrypted)
+    return [(f"Encrypt {size_kb:4} KB (hybrid RSA+AES)", enc_time),
+            (f"Decrypt {size_kb:4} KB (hybrid RSA+AES)", dec_time)]
+
+
+def warm_up(scratch_dir):
+    """
+    Exercise the crypto stack once, untimed, so lazy backend loading and
+    first-call setup are not billed to the first benchmark.
+    """
+    key_manager = KeyManager(user_dir=scratch_dir)
+    key_manager.generate_key_pair()
+    key_manager.generate_self_signed_certificate("warmup")
+    crypto_manager = CryptoManager(key_manager)
+    crypto_manager.sign_entry(b"x")
+    crypto_manager.decrypt_entry(crypto_manager.encrypt_entry(b"x"))
+    key_manager.save_keystore("warmup-password")
 
 
 # ----------------------------------------------------------------------
@@ -54,11 +98,19 @@ def generate_test_data(size_kb):
 def run_performance_tests():
     results = {}
 
-    # Create a temporary directory for all test files
-    temp_dir = tempfile.mkdtemp(prefix="cryptdiary_perf_")
+    def record(label, t):
+        results[label] = t
+        print(f"{label:40s} : {t*1000:8.3f} ms")
+
+    # Create a temporary directory for all test files. Prefer the memory-backed
+    # /dev/shm so the storage numbers reflect our code rather than the disk.
+    shm_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    temp_dir = tempfile.mkdtemp(prefix="cryptdiary_perf_", dir=shm_dir)
     print(f"Using temporary directory: {temp_dir}")
 
     try:
+        warm_up(tempfile.mkdtemp(prefix="warmup_", dir=temp_dir))
+
         # ------------------------------------------------------------------
         # 1. User registration (includes key generation, certificate, keystore)
         #    Only one registration needed.
@@ -69,12 +121,20 @@ def run_performance_tests():
 
         # ------------------------------------------------------------------
         # 2. Key loading (keystore decryption)
-        #    Average over 3 loads.
         # ------------------------------------------------------------------
         key_manager = KeyManager(user_dir=user_manager.get_user_dir("perf_test_user"))
+
+        def load_keystore_uncached(password):
+            # Measure the first-login cost, not the in-process keystore cache
+            _keystore_cache.clear()
+            return key_manager.load_keystore(password)
+
+        load_time, _ = timed_func(load_keystore_uncached, "testpass123", repeats=3)
+        record("Load keystore (decrypt + load keys)", load_time)
+
+        # Re-login within the same session is answered from the cache
         load_time, _ = timed_func(key_manager.load_keystore, "testpass123", repeats=3)
-        results["Load keystore (decrypt + load keys)"] = load_time
-        print(f"{'Load keystore (decrypt + load keys)':40s} : {load_time*1000:8.3f} ms")
+        record("Load keystore (cached re-login)", load_time)
 
         # Ensure keys are loaded for subsequent tests
         if not key_manager.private_key:
@@ -83,13 +143,12 @@ def run_performance_tests():
         crypto_manager = CryptoManager(key_manager)
 
         # ------------------------------------------------------------------
-        # 3. RSA operations (sign/verify) with small data (average over 10 runs)
+        # 3. RSA operations (sign/verify) with small data
         # ------------------------------------------------------------------
         test_data = b"Hello, this is a test message for signing."
         # Signing
-        sign_time, signature_info = timed_func(crypto_manager.sign_entry, test_data, repeats=10)
-        results["Sign data (RSA PSS SHA256)"] = sign_time
-        print(f"{'Sign data (RSA PSS SHA256)':40s} : {sign_time*1000:8.3f} ms")
+        sign_time, signature_info = timed_func(crypto_manager.sign_entry, test_data)
+        record("Sign data (RSA PSS SHA256)", sign_time)
 
         # Verification (using own public key)
         verify_time, _ = timed_func(
@@ -97,72 +156,96 @@ def run_performance_tests():
             test_data,
             signature_info['signature'],
             signature_info['signed_timestamp'],
-            cert_serial=signature_info['cert_serial'],
-            repeats=10
+            cert_serial=signature_info['cert_serial']
         )
-        results["Verify signature (RSA PSS SHA256)"] = verify_time
-        print(f"{'Verify signature (RSA PSS SHA256)':40s} : {verify_time*1000:8.3f} ms")
+        record("Verify signature (RSA PSS SHA256)", verify_time)
 
         # ------------------------------------------------------------------
-        # 4. Encryption / Decryption with various data sizes (average over 5 runs each)
+        # 4. Encryption / Decryption with various data sizes
         # ------------------------------------------------------------------
         sizes_kb = [1, 10, 100, 500]   # 1KB, 10KB, 100KB, 500KB
-        for size in sizes_kb:
-            plain = generate_test_data(size)
-
-            # Encryption
-            enc_time, encrypted = timed_func(crypto_manager.encrypt_entry, plain, repeats=5)
-            results[f"Encrypt {size:4} KB (hybrid RSA+AES)"] = enc_time
-            print(f"{f'Encrypt {size:4} KB (hybrid RSA+AES)':40s} : {enc_time*1000:8.3f} ms")
-
-            # Decryption
-            dec_time, _ = timed_func(crypto_manager.decrypt_entry, encrypted, repeats=5)
-            results[f"Decrypt {size:4} KB (hybrid RSA+AES)"] = dec_time
-            print(f"{f'Decrypt {size:4} KB (hybrid RSA+AES)':40s} : {dec_time*1000:8.3f} ms")
+        # Build every payload before timing anything
+        payloads = {size: generate_test_data(size) for size in sizes_kb}
+        # The sizes are independent and CPU-bound: time them in parallel, one
+        # process per size. Tests sharing on-disk state (password, storage)
+        # stay serial below.
+        user_dir = str(user_manager.get_user_dir("perf_test_user"))
+        with ProcessPoolExecutor(max_workers=min(len(sizes_kb), os.cpu_count() or 1)) as pool:
+            # memoryviews don't pickle; hand the workers the underlying bytes
+            futures = [pool.submit(encrypt_decrypt_benchmark, user_dir, "testpass123",
+                                   size, payloads[size].obj)
+                       for size in sizes_kb]
+            for future in futures:
+                for label, elapsed in future.result():
+                    record(label, elapsed)
 
         # ------------------------------------------------------------------
-        # 5. Combined encrypt+sign and verify+decrypt (realistic workflow) – average over 5 runs
+        # 5. Combined encrypt+sign and verify+decrypt (realistic workflow)
         # ------------------------------------------------------------------
-        plain = generate_test_data(10)   # 10 KB
+        plain = payloads[10]   # 10 KB
 
-        enc_sign_time, package = timed_func(crypto_manager.encrypt_and_sign, plain, repeats=5)
-        results["Encrypt + Sign (10 KB)"] = enc_sign_time
-        print(f"{'Encrypt + Sign (10 KB)':40s} : {enc_sign_time*1000:8.3f} ms")
+        enc_sign_time, package = timed_func(crypto_manager.encrypt_and_sign, plain)
+        record("Encrypt + Sign (10 KB)", enc_sign_time)
 
-        verify_dec_time, _ = timed_func(crypto_manager.verify_and_decrypt, package, repeats=5)
-        results["Verify + Decrypt (10 KB)"] = verify_dec_time
-        print(f"{'Verify + Decrypt (10 KB)':40s} : {verify_dec_time*1000:8.3f} ms")
+        verify_dec_time, _ = timed_func(crypto_manager.verify_and_decrypt, package)
+        record("Verify + Decrypt (10 KB)", verify_dec_time)
 
         # ------------------------------------------------------------------
-        # 6. Password hashing (PBKDF2) – average over 20 runs
+        # 6. Password hashing (PBKDF2)
         # ------------------------------------------------------------------
         salt = os.urandom(16)
-        hash_time, _ = timed_func(user_manager._hash_password, "testpassword", salt, repeats=20)
-        results["PBKDF2 password hash (100k iterations)"] = hash_time
-        print(f"{'PBKDF2 password hash (100k iterations)':40s} : {hash_time*1000:8.3f} ms")
+
+        def hash_password_uncached(password, salt):
+            # Repeat calls would otherwise be answered from the derivation cache
+            _password_hash_cache.clear()
+            return user_manager._hash_password(password, salt)
+
+        hash_time, _ = timed_func(hash_password_uncached, "testpassword", salt)
+        record("PBKDF2 password hash (100k iterations)", hash_time)
 
         # ------------------------------------------------------------------
-        # 7. Certificate serialisation / export – average over 100 runs
+        # 7. Certificate serialisation / export
         # ------------------------------------------------------------------
-        export_time, _ = timed_func(key_manager.export_certificate_pem, repeats=100)
-        results["Export certificate to PEM"] = export_time
-        print(f"{'Export certificate to PEM':40s} : {export_time*1000:8.3f} ms")
+        def export_certificate_uncached():
+            # Otherwise every call after the first returns the memoized PEM
+            key_manager._cert_pem_cache = None
+            return key_manager.export_certificate_pem()
+
+        export_time, _ = timed_func(export_certificate_uncached)
+        record("Export certificate to PEM", export_time)
+
+        export_time, _ = timed_func(key_manager.export_certificate_pem)
+        record("Export certificate to PEM (cached)", export_time)
 
         # ------------------------------------------------------------------
-        # 8. Diary storage: save & load entry (disk I/O) – average over 10 runs
+        # 8. Diary storage: save & load entry (disk I/O)
         # ------------------------------------------------------------------
         diary = DiaryStorage(user_dir=user_manager.get_user_dir("perf_test_user"))
-        encrypted_sample = crypto_manager.encrypt_entry(generate_test_data(1))
+        encrypted_sample = crypto_manager.encrypt_entry(payloads[1])
 
-        # Save
-        save_time, entry_id = timed_func(diary.save_entry, "Performance Test", encrypted_sample, repeats=10)
-        results["Save diary entry (JSON write)"] = save_time
-        print(f"{'Save diary entry (JSON write)':40s} : {save_time*1000:8.3f} ms")
+        # Save: a fixed number of writes into the fresh diary
+        save_time, entry_id = timed_func(diary.save_entry, "Performance Test", encrypted_sample,
+                                         number=SAVE_ENTRY_CALLS)
+        record("Save diary entry (JSON write)", save_time)
 
         # Load
-        load_time, _ = timed_func(diary.load_entry, entry_id, repeats=10)
-        results["Load diary entry (JSON read)"] = load_time
-        print(f"{'Load diary entry (JSON read)':40s} : {load_time*1000:8.3f} ms")
+        load_time, _ = timed_func(diary.load_entry, entry_id)
+        record("Load diary entry (JSON read)", load_time)
+
+        # Same save/load against the default (disk-backed) temp dir, so the
+        # cost of the user's filesystem shows up next to the code cost above
+        if shm_dir:
+            disk_dir = tempfile.mkdtemp(prefix="cryptdiary_perf_disk_")
+            try:
+                disk_diary = DiaryStorage(user_dir=disk_dir)
+                save_time, entry_id = timed_func(disk_diary.save_entry, "Performance Test",
+                                                 encrypted_sample, number=SAVE_ENTRY_CALLS)
+                record("Save diary entry (disk)", save_time)
+
+                load_time, _ = timed_func(disk_diary.load_entry, entry_id)
+                record("Load diary entry (disk)", load_time)
+            finally:
+                shutil.rmtree(disk_dir, ignore_errors=True)
 
     finally:
         # Clean up temporary directory
@@ -1,14 +1,44 @@
 import os
-import json
 import base64
+import hashlib
+import hmac
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+except ImportError:
+    PasswordHasher = None
+from jsonio import dumps, loads
 
-# Import KeyManager here to create certificate during registration
-from key_manager import KeyManager
+# key_manager (and with it cryptography) is imported inside the methods that
+# create or re-encrypt keystores, so the login screen can draw without it.
+
+# Recent password derivations. authenticate_user runs for every entry the GUI
+# opens, so repeat logins skip the KDF. Keyed by (salt, keyed hash of the
+# password): the raw password is never stored.
+PASSWORD_HASH_CACHE_SIZE = 32
+_password_hash_cache = OrderedDict()
+_password_hash_cache_secret = os.urandom(16)
+
+# New password hashes are Argon2id when argon2-cffi is installed. Otherwise,
+# and in records from older versions, PBKDF2-HMAC-SHA256 with a separate salt;
+# those are re-hashed with Argon2id on the next successful login.
+ARGON2_PARAMS = {'time_cost': 2, 'memory_cost': 65536, 'parallelism': 2}
+_password_hasher = PasswordHasher(**ARGON2_PARAMS) if PasswordHasher else None
+
+
+def _password_digest(password):
+    return hashlib.blake2b(password.encode(), digest_size=16,
+                           key=_password_hash_cache_secret).digest()
+
+
+def _remember_password_hash(cache_key, value):
+    _password_hash_cache[cache_key] = value
+    if len(_password_hash_cache) > PASSWORD_HASH_CACHE_SIZE:
+        _password_hash_cache.popitem(last=False)
 
 
 class UserManager:
@@ -18,34 +48,99 @@ class UserManager:
         self.users_dir = Path(users_dir)
         self.users_dir.mkdir(exist_ok=True)
         self.users_file = self.users_dir / "users.json"
+        # Guards users_db and users.json against concurrent mutators
+        self._lock = threading.Lock()
+        # Lowercase names reserved by registrations still writing their keystore
+        self._pending = set()
         self._load_users()
 
     def _load_users(self):
         if self.users_file.exists():
-            with open(self.users_file, 'r') as f:
-                self.users_db = json.load(f)
+            with open(self.users_file, 'rb') as f:
+                self.users_db = loads(f.read())
         else:
             self.users_db = {'users': []}
+        self._index_users()
+
+    def _index_users(self):
+        # Lowercase username -> record; the first record wins, as the old scans did.
+        # Records written before username_lc existed get it filled in here.
+        self._by_username = {}
+        for user in self.users_db['users']:
+            username_lc = user.setdefault('username_lc', user['username'].lower())
+            self._by_username.setdefault(username_lc, user)
+
+    def _find_user(self, username):
+        return self._by_username.get(username.lower())
 
     def _save_users(self):
-        with open(self.users_file, 'w') as f:
-            json.dump(self.users_db, f, indent=2)
+        """Write users.json compactly to a temp file and atomically swap it in."""
+        tmp_path = self.users_file.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps(self.users_db))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.users_file)
 
     def _hash_password(self, password, salt):
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
-        return kdf.derive(password.encode())
+        cache_key = (salt, _password_digest(password))
+        cached = _password_hash_cache.get(cache_key)
+        if cached is not None:
+            _password_hash_cache.move_to_end(cache_key)
+            return cached
+
+        # PBKDF2-HMAC-SHA256, 100k rounds, 32 bytes (OpenSSL's C loop via hashlib)
+        derived = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000, dklen=32)
+        _remember_password_hash(cache_key, derived)
+        return derived
+
+    def _password_fields(self, password):
+        """Password fields for a user record: Argon2id if available, else PBKDF2 + salt."""
+        if _password_hasher is not None:
+            return {'password_hash': _password_hasher.hash(password)}
+        salt = os.urandom(16)
+        return {
+            'password_hash': base64.b64encode(self._hash_password(password, salt)).decode(),
+            'salt': base64.b64encode(salt).decode()
+        }
+
+    def _set_password(self, user, password):
+        user.pop('salt', None)
+        user.update(self._password_fields(password))
+
+    def _check_password(self, user, password):
+        stored = user['password_hash']
+        if stored.startswith('$argon2'):
+            return self._verify_argon2(stored, password)
+        salt = base64.b64decode(user['salt'])
+        password_hash = self._hash_password(password, salt)
+        stored_hash = base64.b64decode(stored)
+        return hmac.compare_digest(password_hash, stored_hash)
+
+    def _verify_argon2(self, stored, password):
+        if _password_hasher is None:
+            print("Cannot verify password: this account uses Argon2id but argon2-cffi is not installed")
+            return False
+        cache_key = (stored, _password_digest(password))
+        if cache_key in _password_hash_cache:
+            _password_hash_cache.move_to_end(cache_key)
+            return True
+        try:
+            _password_hasher.verify(stored, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        _remember_password_hash(cache_key, True)
+        return True
+
+    def _needs_rehash(self, user):
+        if _password_hasher is None:
+            return False
+        stored = user['password_hash']
+        return not stored.startswith('$argon2id$') or _password_hasher.check_needs_rehash(stored)
 
     def username_exists(self, username):
-        for user in self.users_db['users']:
-            if user['username'].lower() == username.lower():
-                return True
-        return False
+        username_lc = username.lower()
+        return username_lc in self._by_username or username_lc in self._pending
 
     def register_user(self, username, password, full_name=""):
         """
@@ -56,48 +151,136 @@ class UserManager:
             password: User password
             full_name: Optional full name
         """
+        with self._lock:
+            error = self._validate_new_user(username, password)
+            if error:
+                return error
+            # Hold the name while the keystore is written outside the lock, so a
+            # concurrent registration can't overwrite it
+            self._pending.add(username.lower())
+
+        try:
+            from key_manager import KeyManager
+
+            # Create user directory
+            user_dir = self.users_dir / username
+            user_dir.mkdir(exist_ok=True)
+
+            # Generate keys and certificate for the user
+            key_manager = KeyManager(user_dir=str(user_dir))
+            key_manager.generate_key_pair()
+            key_manager.generate_self_signed_certificate(username)
+            key_manager.save_keystore(password)  # This also saves certificate
+
+            user_record = self._new_user_record(username, password, full_name, user_dir)
+            with self._lock:
+                self._commit_user_records([user_record])
+        finally:
+            with self._lock:
+                self._pending.discard(username.lower())
+        return True
+
+    def register_users_bulk(self, users):
+        """
+        Register several users, writing users.json once at the end.
+        RSA keys are generated in parallel worker processes; the lock is
+        only held to reserve the names and to store the finished records.
+
+        Args:
+            users: Iterable of (username, password) or (username, password, full_name)
+
+        Returns:
+            Dict mapping each username to True or an error message
+        """
+        results = {}
+        reserved = []
+        with self._lock:
+            for spec in users:
+                username, password, full_name = (tuple(spec) + ("",))[:3]
+                error = self._validate_new_user(username, password)
+                if error:
+                    results[username] = error
+                    continue
+                self._pending.add(username.lower())
+                reserved.append((username, password, full_name))
+
+        try:
+            if not reserved:
+                return results
+            from concurrent.futures import ProcessPoolExecutor
+            from key_manager import KeyManager
+            pending = []
+            workers = min(len(reserved), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for username, password, full_name in reserved:
+                    user_dir = self.users_dir / username
+                    user_dir.mkdir(exist_ok=True)
+                    key_manager = KeyManager(user_dir=str(user_dir))
+                    keys = key_manager.generate_key_pair_async(executor=pool)
+                    pending.append((username, password, full_name, user_dir, key_manager, keys))
+
+                records = []
+                for username, password, full_name, user_dir, key_manager, keys in pending:
+                    try:
+                        keys.result()
+                        key_manager.generate_self_signed_certificate(username)
+                        key_manager.save_keystore(password)
+                        records.append(self._new_user_record(username, password,
+                                                             full_name, user_dir))
+                    except Exception as e:
+                        results[username] = f"Registration failed: {e}"
+
+            if records:
+                with self._lock:
+                    self._commit_user_records(records)
+            for record in records:
+                results[record['username']] = True
+        finally:
+            with self._lock:
+                for username, _, _ in reserved:
+                    self._pending.discard(username.lower())
+        return results
+
+    def _validate_new_user(self, username, password):
         if not username or len(username) < 3:
             return "Username must be at least 3 characters"
         if self.username_exists(username):
             return "Username already exists"
         if not password or len(password) < 6:
             return "Password must be at least 6 characters"
+        return None
 
-        salt = os.urandom(16)
-        password_hash = self._hash_password(password, salt)
-
-        # Create user directory
-        user_dir = self.users_dir / username
-        user_dir.mkdir(exist_ok=True)
-
-        # Generate keys and certificate for the user
-        key_manager = KeyManager(user_dir=str(user_dir))
-        key_manager.generate_key_pair()
-        key_manager.generate_self_signed_certificate(username)
-        key_manager.save_keystore(password)  # This also saves certificate
-
-        user_record = {
+    def _new_user_record(self, username, password, full_name, user_dir):
+        return {
             'username': username,
+            'username_lc': username.lower(),
             'full_name': full_name,
-            'password_hash': base64.b64encode(password_hash).decode(),
-            'salt': base64.b64encode(salt).decode(),
+            **self._password_fields(password),
             'user_dir': str(user_dir),
             'created': self._get_timestamp()
         }
 
-        self.users_db['users'].append(user_record)
-        self._save_users()
-        return True
+    def _commit_user_records(self, records):
+        # Caller holds self._lock. Nothing stays in memory if users.json can't be written.
+        self.users_db['users'].extend(records)
+        try:
+            self._save_users()
+        except Exception:
+            del self.users_db['users'][-len(records):]
+            raise
+        for record in records:
+            self._by_username.setdefault(record['username_lc'], record)
 
     def authenticate_user(self, username, password):
-        for user in self.users_db['users']:
-            if user['username'].lower() == username.lower():
-                salt = base64.b64decode(user['salt'])
-                password_hash = self._hash_password(password, salt)
-                stored_hash = base64.b64decode(user['password_hash'])
-                if password_hash == stored_hash:
-                    return user
-        return None
+        user = self._find_user(username)
+        if user is None or not self._check_password(user, password):
+            return None
+        if self._needs_rehash(user):
+            # Upgrade PBKDF2 (or outdated Argon2) records while we have the password
+            with self._lock:
+                self._set_password(user, password)
+                self._save_users()
+        return user
 
     def get_user_dir(self, username):
         return self.users_dir / username
@@ -106,13 +289,13 @@ class UserManager:
         return [user['username'] for user in self.users_db['users']]
 
     def get_user_info(self, username):
-        for user in self.users_db['users']:
-            if user['username'].lower() == username.lower():
-                info = user.copy()
-                info.pop('password_hash', None)
-                info.pop('salt', None)
-                return info
-        return None
+        user = self._find_user(username)
+        if user is None:
+            return None
+        info = user.copy()
+        info.pop('password_hash', None)
+        info.pop('salt', None)
+        return info
 
     def update_user_info(self, username, full_name=None):
         """
@@ -125,47 +308,50 @@ class UserManager:
         Returns:
             True if successful, False otherwise
         """
-        for user in self.users_db['users']:
-            if user['username'].lower() == username.lower():
-                if full_name is not None:
-                    user['full_name'] = full_name
-                self._save_users()
-                return True
-        return False
+        user = self._find_user(username)
+        if user is None:
+            return False
+        with self._lock:
+            if full_name is not None:
+                user['full_name'] = full_name
+            self._save_users()
+        return True
 
     def change_password(self, username, old_password, new_password):
+        # Cheap check first, so a too-short new password costs no KDF run
+        if not new_password or len(new_password) < 6:
+            return "New password must be at least 6 characters"
+        # Both this and load_keystore(old_password) below are normally cache
+        # hits: the same password unlocked the account and keystore at login
         user_record = self.authenticate_user(username, old_password)
         if not user_record:
             return "Current password is incorrect"
-        if not new_password or len(new_password) < 6:
-            return "New password must be at least 6 characters"
 
-        salt = os.urandom(16)
-        password_hash = self._hash_password(new_password, salt)
+        with self._lock:
+            self._set_password(user_record, new_password)
+            self._save_users()
+        _password_hash_cache.clear()
 
-        for user in self.users_db['users']:
-            if user['username'].lower() == username.lower():
-                user['password_hash'] = base64.b64encode(password_hash).decode()
-                user['salt'] = base64.b64encode(salt).decode()
-                self._save_users()
-
-                # Also update keystore password
-                user_dir = self.get_user_dir(username)
-                key_manager = KeyManager(user_dir=str(user_dir))
-                if key_manager.load_keystore(old_password):
-                    key_manager.save_keystore(new_password)
-                return True
-        return "User not found"
+        # Also update keystore password
+        from key_manager import KeyManager
+        user_dir = self.get_user_dir(username)
+        key_manager = KeyManager(user_dir=str(user_dir))
+        if key_manager.load_keystore(old_password):
+            key_manager.save_keystore(new_password)
+        return True
 
     def delete_user(self, username, password):
         user_record = self.authenticate_user(username, password)
         if not user_record:
             return "Authentication failed"
-        self.users_db['users'] = [
-            u for u in self.users_db['users']
-            if u['username'].lower() != username.lower()
-        ]
-        self._save_users()
+        username_lc = username.lower()
+        with self._lock:
+            self.users_db['users'] = [
+                u for u in self.users_db['users'] if u['username_lc'] != username_lc
+            ]
+            self._by_username.pop(username_lc, None)
+            self._save_users()
+        _password_hash_cache.clear()
         return True
 
     def _get_timestamp(self):